@@ -0,0 +1,2418 @@
+"""Headless core of the CCNA command reference: topic storage, search and
+syntax highlighting, usable without creating a Tk window.
+
+TopicStore, SearchEngine and SyntaxHighlighter have blocking methods plus
+*_async coroutines that run them in a worker thread (asyncio.to_thread)."""
+import array
+import asyncio
+import bisect
+import gzip
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import unicodedata
+import zlib
+from collections import OrderedDict, namedtuple
+from collections.abc import MutableMapping
+from functools import lru_cache
+
+# --- Data Files ---
+SEED_DB_FILE = "cisco_ccna_defaults.json.gz"   # default topics, used when no database exists
+NOTES_PLACEHOLDER = '⚠️ No SHAR7 added yet. Click "EDIT SHAR7" to add explanation.'
+
+
+def resource_path(name):
+    """Locate a bundled data file (source tree or PyInstaller bundle)"""
+    base_dir = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, name)
+
+
+def load_seed_data():
+    """Return the default CCNA database (read from the compressed seed resource)"""
+    with gzip.open(resource_path(SEED_DB_FILE), 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+# --- Persistence Config ---
+JOURNAL_COMPACT_BYTES = 512 * 1024   # fold the edit journal into the database past this size
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")   # database names that select the SQLite backend
+BODY_CACHE_SIZE = 256                # topic bodies kept in memory by the SQLite backend
+COMMAND_CACHE_SUFFIX = ".commands.json"   # parsed IOS command catalog, next to the database
+COMMAND_CACHE_VERSION = 1
+SEARCH_INDEX_VERSION = 1             # layout of the search tables kept in a SQLite database
+SEARCH_INDEX_BATCH = 64              # topics re-indexed per transaction
+
+# --- Search Config ---
+SEARCH_FIELDS = ("title", "code", "verification", "example", "notes")
+TOKEN_RE = re.compile(r"\w+")
+SNIPPET_RADIUS = 60     # characters shown around a match in ranked results
+REGEX_CACHE_SIZE = 64   # compiled search patterns kept
+NARROW_CACHE_SIZE = 8   # recent substring results reused when the query is extended
+QUERY_CACHE_SIZE = 64   # finished searches kept per (query, options, data version)
+# Search folding: marks (Arabic tashkeel, accents), format characters and emoji are dropped,
+# Arabic letter variants folded (hamza/madda alef forms fold through the dropped marks)
+SEARCH_DROP_CATEGORIES = frozenset(("Mn", "Me", "Cf", "Cs", "So"))
+EMOJI_MODIFIERS = range(0x1F3FB, 0x1F400)   # skin tones (category Sk)
+SEARCH_BLANKS = (" ", "\t")   # collapsed into one where a dropped character separated them
+ARABIC_LETTER_FOLDS = {"\u0671": "\u0627",    # alef wasla -> alef
+                       "\u0649": "\u064A",    # alef maksura -> yaa
+                       "\u0640": ""}          # tatweel
+REGEX_TIME_BUDGET = 0.5   # seconds a regex search may run before its worker process is killed
+REGEX_POLL_INTERVAL = 0.02   # seconds between deadline/cancellation checks while a regex runs
+# A group repeating a repeated item, e.g. (a+)+ or (\w*)* : rejected up front with a clear message
+# (anything else that backtracks too long is stopped by the time budget)
+NESTED_QUANTIFIER_RE = re.compile(r"\((?:[^()\\]|\\.)*[+*}]\)(?:[+*]|\{\d*,)")
+
+
+def topic_search_text(title, item_data):
+    """Text searched for a topic: the title and every field, space separated"""
+    return f"{title} {item_data['code']} {item_data.get('verification', '')} {item_data.get('example', '')} {item_data.get('notes', '')}"
+
+
+def topic_hash(title, item_data):
+    """Digest of the searchable text of a topic (tells stale on-disk search rows apart)"""
+    return hashlib.sha1(topic_search_text(title, item_data).encode("utf-8")).hexdigest()
+
+
+def topic_list(data):
+    """[(tab, title, topic)] of a {tab: {title: topic}} database, in database order.
+    Indexes are built from such a snapshot, taken on the thread that edits the data."""
+    return [(tab_name, title, item_data)
+            for tab_name, tab_data in data.items() for title, item_data in tab_data.items()]
+
+
+@lru_cache(maxsize=None)
+def fold_char(char):
+    """Search form of one character: NFKC, casefolded, without marks or
+    emoji, Arabic letter variants folded ('' if nothing is left)"""
+    decomposed = unicodedata.normalize("NFKD", unicodedata.normalize("NFKD", char).casefold())
+    kept = "".join(ARABIC_LETTER_FOLDS.get(c, c) for c in decomposed
+                   if unicodedata.category(c) not in SEARCH_DROP_CATEGORIES and ord(c) not in EMOJI_MODIFIERS)
+    return unicodedata.normalize("NFKC", kept)
+
+
+def fold_search_text(text):
+    """(folded text, offset map) where offset_map[i] is the index in text of the
+    character folded[i] came from. The map is None when every character folds
+    to exactly one character (always the case for ASCII text)."""
+    if text.isascii():
+        return text.lower(), None
+    parts = [fold_char(char) for char in text]
+    # A dropped character between two spaces ("01. 🔧 Basic") leaves one space, not two
+    previous = ""
+    dropped = False
+    for i, part in enumerate(parts):
+        if not part:
+            dropped = True
+            continue
+        if dropped and part in SEARCH_BLANKS and previous in SEARCH_BLANKS:
+            parts[i] = ""
+        else:
+            previous = part[-1]
+        dropped = False
+    folded = "".join(parts)
+    if len(folded) == len(text) and all(len(part) == 1 for part in parts):
+        return folded, None
+    offset_map = []
+    for i, part in enumerate(parts):
+        offset_map.extend([i] * len(part))
+    return folded, offset_map
+
+
+def normalize_search_text(text):
+    """Form in which topics are indexed and queries compared (see fold_search_text)"""
+    return fold_search_text(text)[0]
+
+
+def fold_topic_fields(title, item_data):
+    """(search text, ((field, start, end), ...), {field: offset map}) of a topic. The
+    folded fields are joined like topic_search_text, so a query may span two fields;
+    offset maps are only kept for the fields whose folding is not 1:1."""
+    texts = []
+    bounds = []
+    offset_maps = {}
+    start = 0
+    for field in SEARCH_FIELDS:
+        folded, offset_map = fold_search_text(title if field == "title" else item_data.get(field, ''))
+        texts.append(folded)
+        bounds.append((field, start, start + len(folded)))
+        start += len(folded) + 1
+        if offset_map is not None:
+            offset_maps[field] = offset_map
+    return " ".join(texts), tuple(bounds), offset_maps
+
+
+def slice_fields(text, bounds, offset_maps):
+    """(field, folded text, offset map or None) of each field of a fold_topic_fields() text"""
+    for field, start, end in bounds:
+        yield field, text[start:end], offset_maps.get(field)
+
+
+def field_match_spans(fields, query, pattern=None):
+    """{field: spans} of every occurrence of a folded query in slice_fields() output"""
+    spans = {}
+    for field, text, offset_map in fields:
+        offsets = find_offsets(text, query, pattern)
+        if offsets:
+            spans[field] = offsets_to_spans(text, offsets, offset_map)
+    return spans
+
+
+def field_term_spans(fields, terms):
+    """{field: spans} of the tokens (TOKEN_RE matches) equal to one of the terms"""
+    pattern = re.compile(r"(?<!\w)(?:" + "|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+                         + r")(?!\w)")
+    spans = {}
+    for field, text, offset_map in fields:
+        offsets = [(match.start(), match.end() - match.start()) for match in pattern.finditer(text)]
+        if offsets:
+            spans[field] = offsets_to_spans(text, offsets, offset_map)
+    return spans
+
+
+def scan_unfolded(items, query, exact, tabs, is_cancelled, with_spans):
+    """Keys (or SearchMatches) of the {key: topic} items whose lowercased, unfolded
+    text contains query (see raw_match_spans), in the order of items"""
+    pattern = word_pattern(query) if exact else None
+    results = []
+    for i, (key, item_data) in enumerate(items):
+        if is_cancelled is not None and i % 64 == 0 and is_cancelled():
+            raise SearchCancelled()
+        if tabs is not None and key[0] not in tabs:
+            continue
+        text = topic_search_text(key[1], item_data).lower()
+        if not (pattern.search(text) if pattern is not None else query in text):
+            continue
+        if with_spans:
+            spans = {}
+            for field in SEARCH_FIELDS:
+                field_spans = raw_match_spans(key[1] if field == "title" else item_data.get(field, ''),
+                                              query, pattern)
+                if field_spans:
+                    spans[field] = field_spans
+            results.append(SearchMatch(key[0], key[1], spans))
+        else:
+            results.append(key)
+    return results
+
+
+def unfolded_field_texts(key, item_data):
+    """(field, unfolded text, None) of one topic, for regexes that run on the unfolded text"""
+    return [(field, key[1] if field == "title" else item_data.get(field, ''), None) for field in SEARCH_FIELDS]
+
+
+def regex_hit_matches(hits, topics, fields_of, tabs, with_spans):
+    """Keys or SearchMatches of RegexWorker hits. topics[i] is the (key, source) the
+    worker got as topic i, fields_of(key, source) its slice_fields()-like fields."""
+    results = []
+    for i, field_hits in hits:
+        key, source = topics[i]
+        if tabs is not None and key[0] not in tabs:
+            continue
+        if not with_spans:
+            results.append(key)
+            continue
+        fields = fields_of(key, source)
+        spans = {}
+        for j, offsets in field_hits:
+            field, field_text, offset_map = fields[j]
+            offsets = [offset for offset in offsets if offset[1]]
+            if offsets:
+                spans[field] = offsets_to_spans(field_text, offsets, offset_map)
+        results.append(SearchMatch(key[0], key[1], spans))
+    return results
+
+
+def fuzzy_term_distance(token, term, max_edits, grams=None):
+    """Edit distance of a term to a query token if it is within max_edits and
+    shares enough trigrams with it (one edit changes at most three), else None"""
+    grams = grams if grams is not None else term_trigrams(token)
+    if len(grams & term_trigrams(term)) < max(1, len(grams) - 3 * max_edits):
+        return None
+    distance = edit_distance(token, term, max_edits)
+    return distance if distance <= max_edits else None
+
+
+SearchMatch = namedtuple("SearchMatch", "tab title spans")
+
+
+def find_offsets(lowered, query, pattern=None):
+    """(offset, length) of every occurrence of query in an already lowered text
+    (pattern is the word-bounded regex used for Exact Match)"""
+    if pattern is not None:
+        return [(m.start(), m.end() - m.start()) for m in pattern.finditer(lowered) if m.end() > m.start()]
+    offsets = []
+    pos = lowered.find(query) if query else -1
+    while pos != -1:
+        offsets.append((pos, len(query)))
+        pos = lowered.find(query, pos + len(query))
+    return offsets
+
+
+def match_spans(text, query, pattern=None):
+    """(line, column, length) of every occurrence of a normalized query in text.
+    Lines are 1-based, columns are offsets in the original text."""
+    folded, offset_map = fold_search_text(text)
+    return offsets_to_spans(folded, find_offsets(folded, query, pattern), offset_map)
+
+
+def raw_match_spans(text, query, pattern=None):
+    """Same as match_spans on the lowercased, unfolded text (for a query made only
+    of characters that folding drops, such as emoji)"""
+    lowered = text.lower()
+    return offsets_to_spans(lowered, find_offsets(lowered, query, pattern))
+
+
+def unfold_offsets(offsets, offset_map):
+    """Map (offset, length) pairs in a folded text back to the original text"""
+    if offset_map is None:
+        return offsets
+    return [(offset_map[pos], offset_map[pos + length - 1] + 1 - offset_map[pos]) for pos, length in offsets]
+
+
+def offsets_to_spans(text, offsets, offset_map=None):
+    """Turn sorted (offset, length) pairs into (line, column, length) spans.
+    With the offset_map of a folded text, columns and lengths are given in the
+    original text (folding never drops or adds line breaks)."""
+    spans = []
+    line, line_start = 1, 0
+    for pos, length in offsets:
+        newlines = text.count('\n', line_start, pos)
+        if newlines:
+            line += newlines
+            line_start = text.rfind('\n', 0, pos) + 1
+        if offset_map is None:
+            spans.append((line, pos - line_start, length))
+        else:
+            origin = offset_map[line_start - 1] + 1 if line_start else 0
+            start = offset_map[pos]
+            spans.append((line, start - origin, offset_map[pos + length - 1] + 1 - start))
+    return spans
+
+
+def fuzzy_max_edits(token):
+    """Typos tolerated in a query token: none for short tokens, more for long ones"""
+    if len(token) < 4:
+        return 0
+    return 1 if len(token) < 8 else 2
+
+
+def term_trigrams(term):
+    """Trigrams of a term padded with '$' (so short terms still have some)"""
+    padded = f"${term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, limit):
+    """Levenshtein distance of a and b, or limit + 1 as soon as it must exceed limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+class SearchCancelled(Exception):
+    """Raised inside a search worker when a newer query superseded it"""
+
+
+class SearchPatternError(Exception):
+    """A regex query that is invalid (often just half typed) or too slow to run"""
+
+
+@lru_cache(maxsize=REGEX_CACHE_SIZE)
+def word_pattern(query):
+    """Exact Match pattern for a lowercase query (compiled once per query)"""
+    return re.compile(r'\b' + re.escape(query) + r'\b')
+
+
+def fold_regex(pattern):
+    """pattern with its non-ASCII literal characters folded like the searched text
+    (see fold_char), or None if it names a character folding drops (an emoji
+    or symbol), in which case it has to run on the unfolded text"""
+    if pattern.isascii():
+        return pattern
+    parts = []
+    class_start = None   # index in parts of the first item of an open [...] class
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        i += 1
+        if char == "\\" and i < len(pattern):
+            # An escaped ASCII character is kept as is; an escaped non-ASCII one is a literal
+            char = pattern[i]
+            i += 1
+            if char.isascii():
+                parts.append("\\" + char)
+                continue
+        elif char.isascii():
+            if char == "[" and class_start is None:
+                class_start = len(parts) + 1
+            elif char == "^" and class_start == len(parts):
+                class_start += 1
+            elif char == "]" and class_start is not None and len(parts) > class_start:
+                class_start = None   # a ] first in the class is a literal
+            parts.append(char)
+            continue
+        folded = fold_char(char)
+        if not folded:
+            if unicodedata.category(char) not in ("Mn", "Me"):
+                return None
+            continue
+        if class_start is not None and len(folded) != 1:
+            return None
+        # Grouped so a following quantifier repeats the whole folded form
+        parts.append(re.escape(folded) if len(folded) == 1 else f"(?:{re.escape(folded)})")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=REGEX_CACHE_SIZE)
+def compile_search_regex(pattern):
+    """Compile a user regex once (case-insensitive, ^/$ per line). Literal
+    characters are folded like the searched text; a pattern naming an emoji
+    or symbol is compiled as typed and run on the unfolded text."""
+    if NESTED_QUANTIFIER_RE.search(pattern):
+        raise SearchPatternError("Nested repeats like (a+)+ are not allowed")
+    folded = fold_regex(pattern)
+    try:
+        return re.compile(pattern if folded is None else folded, re.IGNORECASE | re.MULTILINE)
+    except re.error as e:
+        raise SearchPatternError(f"Invalid regex: {e}")
+
+
+def regex_runs_on_raw(pattern):
+    """True if a compiled user regex matches the unfolded text (see compile_search_regex)"""
+    return not pattern.pattern.isascii() and fold_regex(pattern.pattern) is None
+
+
+def regex_line_offsets(text, pattern, deadline=None, first_only=False):
+    """(offset, length) of every match of a user regex in text (zero-length ones
+    included), matched line by line so a match never spans lines. deadline, a
+    time.perf_counter() value, is checked between lines only: a line that
+    backtracks for ever is stopped by RegexWorker, which runs this.
+    first_only stops at the first match."""
+    offsets = []
+    line_start = 0
+    for line in text.split('\n'):
+        if deadline is not None and time.perf_counter() > deadline:
+            raise SearchPatternError("Regex search took too long, try a simpler pattern")
+        for match in pattern.finditer(line):
+            offsets.append((line_start + match.start(), match.end() - match.start()))
+            if first_only:
+                return offsets
+        line_start += len(line) + 1
+    return offsets
+
+
+def regex_match_spans(text, pattern, timeout=REGEX_TIME_BUDGET):
+    """(line, column, length) spans of a user regex in the normalized form of text
+    (in text itself for a pattern that runs on the unfolded text). Runs in the
+    regex worker: SearchPatternError once it takes longer than timeout seconds."""
+    if regex_runs_on_raw(pattern):
+        folded, offset_map = text, None
+    else:
+        folded, offset_map = fold_search_text(text)
+    hits = regex_worker.run(pattern, [[folded]], timeout=timeout)
+    offsets = [offset for offset in hits[0][1][0][1] if offset[1]] if hits else []
+    return offsets_to_spans(folded, offsets, offset_map)
+
+
+# ============ REGEX WORKER ============
+def regex_worker_main(conn):
+    """Loop of the regex worker process: one search per request, replying
+    [(topic index, [(field index, offsets), ...]), ...]"""
+    conn.send("ready")
+    cached = []
+    while True:
+        try:
+            source, flags, first_only, tag, topics = conn.recv()
+        except EOFError:
+            return
+        if topics is None:
+            topics = cached
+        elif tag is not None:
+            cached = topics
+        pattern = re.compile(source, flags)
+        results = []
+        for i, fields in enumerate(topics):
+            hits = []
+            for j, text in enumerate(fields):
+                offsets = regex_line_offsets(text, pattern, first_only=first_only)
+                if offsets:
+                    hits.append((j, offsets))
+                    if first_only:
+                        break
+            if hits:
+                results.append((i, hits))
+        conn.send(results)
+
+
+class RegexWorker:
+    """Child process that runs user regexes. Python's re holds the GIL and
+    cannot be interrupted while it backtracks, so a pattern that overruns its
+    time budget is stopped by killing the process (the next search starts a
+    new one). Topic texts sent with a tag are kept by the child and not sent
+    again while the tag stays the same."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._process = None
+        self._conn = None
+        self._sent_tag = None
+
+    def run(self, pattern, topics, first_only=False, tag=None, timeout=REGEX_TIME_BUDGET, is_cancelled=None):
+        """[(topic index, [(field index, [(offset, length), ...]), ...]), ...] of the
+        topics (lists of field texts, or a function returning them) a compiled
+        pattern matches. Raises SearchPatternError when the search takes longer
+        than timeout seconds and SearchCancelled if is_cancelled() turned true."""
+        with self._lock:
+            try:
+                return self._run(pattern, topics, first_only, tag, timeout, is_cancelled)
+            except (EOFError, OSError) as e:
+                # The worker died (or could not start): the next search starts a new one
+                self._stop()
+                raise SearchPatternError(f"Regex search failed: {e or 'worker stopped'}")
+
+    def _run(self, pattern, topics, first_only, tag, timeout, is_cancelled):
+        if self._process is None or not self._process.is_alive():
+            self._start()
+        if tag is not None and tag == self._sent_tag:
+            payload = None
+        else:
+            payload = topics() if callable(topics) else topics
+            if tag is not None:
+                self._sent_tag = tag
+        self._conn.send((pattern.pattern, pattern.flags, first_only, tag, payload))
+        deadline = time.perf_counter() + timeout
+        while not self._conn.poll(REGEX_POLL_INTERVAL):
+            if time.perf_counter() > deadline:
+                self._stop()
+                raise SearchPatternError("Regex search took too long, try a simpler pattern")
+        # A cancelled search still runs to its end (at most timeout): restarting the
+        # worker would cost more than waiting, and the next search needs it anyway
+        results = self._conn.recv()
+        if is_cancelled is not None and is_cancelled():
+            raise SearchCancelled()
+        return results
+
+    def close(self):
+        with self._lock:
+            self._stop()
+
+    def _start(self):
+        # spawn: forking a process that has other threads running is not safe
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(target=regex_worker_main, args=(child_conn,),
+                                        name="regex-worker", daemon=True)
+        self._process.start()
+        child_conn.close()
+        self._conn.recv()   # started: the time budget does not include the interpreter start-up
+        self._sent_tag = None
+
+    def _stop(self):
+        if self._process is not None:
+            self._process.kill()
+            self._process.join()
+            self._conn.close()
+        self._process = None
+        self._conn = None
+
+
+regex_worker = RegexWorker()
+# Each index change takes a new number, so the worker knows when its topic texts are stale
+index_generations = itertools.count()
+
+
+# ============ SEARCH INDEX ============
+class SearchIndex:
+    """Token-level inverted index over every searchable topic field"""
+
+    def __init__(self):
+        # term -> {(tab, title): [(field, offset), ...]}
+        self.postings = {}
+        # (tab, title) -> set of terms (used to unlink a topic on edit)
+        self.topic_terms = {}
+        # (tab, title) -> insertion sequence (keeps results in database order)
+        self.order = {}
+        # (tab, title) -> normalized text of the whole topic (used to verify candidates).
+        # Computed once per edit, so a query allocates no per-topic text.
+        self.search_texts = {}
+        # (tab, title) -> ((field, start, end), ...) of each field within its search text
+        self.field_bounds = {}
+        # (tab, title) -> {field: offset map} for the fields whose folding is not 1:1
+        self.offset_maps = {}
+        # (tab, title) -> topic record (not copied; read only by the unfolded fallback search)
+        self.items = {}
+        # (query, tabs) -> results of recent substring searches, for narrowing
+        self._narrow_cache = OrderedDict()
+        # trigram -> set of terms (candidate terms for fuzzy matching)
+        self.trigrams = {}
+        self._next_seq = 0
+        self._vocab = None
+        self._vocab_reversed = None
+        self.generation = next(index_generations)   # changes with every build/edit
+        # Searches run on a worker thread while edits happen on the Tk thread
+        self._lock = threading.Lock()
+        # Set once the first build finished (the build runs in the background)
+        self.ready = threading.Event()
+
+    def build(self, data):
+        """Index every topic of the database ({tab: {title: topic}} or its topic_list()).
+        ready is set even if the build fails, so edits and searches never wait for ever."""
+        topics = data if isinstance(data, list) else topic_list(data)
+        try:
+            with self._lock:
+                self.postings = {}
+                self.topic_terms = {}
+                self.order = {}
+                self.search_texts = {}
+                self.field_bounds = {}
+                self.offset_maps = {}
+                self.items = {}
+                self.trigrams = {}
+                self._next_seq = 0
+                for tab_name, title, item_data in topics:
+                    self._add_topic(tab_name, title, item_data)
+                self._vocab = None
+                self._narrow_cache.clear()
+                self.generation = next(index_generations)
+        finally:
+            self.ready.set()
+
+    def update_topic(self, tab_name, title, item_data):
+        """Re-index one topic after it was added or edited"""
+        self.ready.wait()
+        with self._lock:
+            self._remove_topic(tab_name, title)
+            self._add_topic(tab_name, title, item_data)
+            self._vocab = None
+            self._narrow_cache.clear()
+            self.generation = next(index_generations)
+
+    def remove_topic(self, tab_name, title):
+        """Drop one topic from the index"""
+        self.ready.wait()
+        with self._lock:
+            self._remove_topic(tab_name, title)
+            self.order.pop((tab_name, title), None)
+            self._vocab = None
+            self._narrow_cache.clear()
+            self.generation = next(index_generations)
+
+    def lookup(self, term):
+        """Return the posting list of a term as (tab, title, field, offset) tuples"""
+        return [(key[0], key[1], field, offset)
+                for key, hits in self.postings.get(term, {}).items()
+                for field, offset in hits]
+
+    def search(self, query, exact=False, tabs=None, is_cancelled=None, with_spans=False, fuzzy=False,
+               regex=False):
+        """Return matching (tab, title) keys in database order, or SearchMatches
+        carrying per-field (line, column, length) spans if with_spans is set.
+        fuzzy (ignored with exact) also accepts terms within a few typos, ranked by distance.
+        regex treats the query as a regular expression (raises SearchPatternError)."""
+        self.ready.wait()
+        if regex:
+            # The user pattern runs outside the lock, so edits never wait for it
+            return self._regex_search(query, tabs, is_cancelled, with_spans)
+        with self._lock:
+            folded = normalize_search_text(query)
+            if not folded.strip():
+                # Only emoji/symbols, which folding drops: a folded query would match everything
+                return self._raw_search(query.lower(), exact, tabs, is_cancelled, with_spans)
+            query = folded
+            if fuzzy and not exact:
+                return self._fuzzy_search(query, tabs, is_cancelled, with_spans)
+            return self._search(query, exact, tabs, is_cancelled, with_spans)
+
+    def _search(self, query, exact, tabs, is_cancelled, with_spans=False):
+        # Extending a recent substring query ("os" -> "osp") can only drop topics:
+        # verify just the previous results instead of the index candidates
+        narrowed = None if exact else self._narrowed_candidates(query, tabs)
+        if narrowed is not None:
+            candidates = narrowed
+        else:
+            candidates = self._candidates(query, exact)
+            if candidates is None:
+                candidates = list(self.order)
+        if tabs is not None:
+            candidates = [key for key in candidates if key[0] in tabs]
+
+        pattern = word_pattern(query) if exact else None
+        results = []
+        for i, key in enumerate(candidates):
+            if is_cancelled is not None and i % 64 == 0 and is_cancelled():
+                raise SearchCancelled()
+            searchable_text = self.search_texts.get(key)
+            if searchable_text is None:
+                continue
+            if pattern is not None:
+                if pattern.search(searchable_text):
+                    results.append(key)
+            elif query in searchable_text:
+                results.append(key)
+        results.sort(key=self.order.__getitem__)
+        if not exact:
+            cache_key = (query, tuple(tabs) if tabs is not None else None)
+            self._narrow_cache[cache_key] = results
+            self._narrow_cache.move_to_end(cache_key)
+            if len(self._narrow_cache) > NARROW_CACHE_SIZE:
+                self._narrow_cache.popitem(last=False)
+        if with_spans:
+            # Computed here, on the search thread, so rendering never re-searches
+            return [SearchMatch(key[0], key[1], self._match_spans(key, query, pattern)) for key in results]
+        return results
+
+    def _fuzzy_search(self, query, tabs, is_cancelled, with_spans):
+        """Substring matches first, then topics where every query token is within
+        fuzzy_max_edits of some term, ranked by the summed edit distance"""
+        substring_hits = set(self._search(query, False, tabs, is_cancelled))
+        scores = {key: 0 for key in substring_hits}
+        matched_terms = {}      # fuzzy-only topic -> terms that matched
+        topic_scores = None
+        for token in TOKEN_RE.findall(query):
+            if is_cancelled is not None and is_cancelled():
+                raise SearchCancelled()
+            best = {}
+            terms = {}
+            for term, distance in self._fuzzy_terms(token).items():
+                for key in self.postings[term]:
+                    if tabs is not None and key[0] not in tabs:
+                        continue
+                    if key not in best or distance < best[key]:
+                        best[key] = distance
+                    terms.setdefault(key, []).append(term)
+            if topic_scores is None:
+                topic_scores = best
+            else:
+                topic_scores = {key: score + best[key] for key, score in topic_scores.items() if key in best}
+            for key in topic_scores:
+                matched_terms.setdefault(key, []).extend(terms[key])
+            if not topic_scores:
+                break
+
+        for key, score in (topic_scores or {}).items():
+            scores.setdefault(key, score)
+        results = sorted(scores, key=lambda key: (scores[key], self.order[key]))
+        if not with_spans:
+            return results
+
+        matches = []
+        for key in results:
+            if key in substring_hits:
+                spans = self._match_spans(key, query)
+            else:
+                spans = self._term_spans(key, matched_terms[key])
+            matches.append(SearchMatch(key[0], key[1], spans))
+        return matches
+
+    def _raw_search(self, query, exact, tabs, is_cancelled, with_spans):
+        """Scan the lowercased, unfolded text of every topic (see raw_match_spans)"""
+        results = scan_unfolded(self.items.items(), query, exact, tabs, is_cancelled, with_spans)
+        results.sort(key=lambda match: self.order[(match[0], match[1])])
+        return results
+
+    def _regex_search(self, query, tabs, is_cancelled, with_spans):
+        """Match a regex against the normalized text of every field, line by line,
+        in the regex worker process (killed past REGEX_TIME_BUDGET). The topics
+        are snapshotted under the lock; the worker keeps their texts until the
+        index changes, so repeated searches only send the pattern."""
+        pattern = compile_search_regex(query)
+        raw = regex_runs_on_raw(pattern)
+        with self._lock:
+            # References only: the texts are sliced when the worker needs them or a topic matched
+            if raw:
+                snapshot = list(self.items.items())
+            else:
+                snapshot = [(key, (self.search_texts[key], self.field_bounds[key], self.offset_maps[key]))
+                            for key in self.items]
+            tag = (self.generation, raw)
+            order = dict(self.order)
+
+        def fields_of(key, source):
+            return unfolded_field_texts(key, source) if raw else list(slice_fields(*source))
+
+        hits = regex_worker.run(pattern, lambda: [[text for _, text, _ in fields_of(key, source)]
+                                                  for key, source in snapshot],
+                                first_only=not with_spans, tag=tag, is_cancelled=is_cancelled)
+        results = regex_hit_matches(hits, snapshot, fields_of, tabs, with_spans)
+        results.sort(key=lambda match: order[(match[0], match[1])])
+        return results
+
+    def _narrowed_candidates(self, query, tabs):
+        """Results of the longest recent substring query contained in this one
+        (with a scope covering tabs), or None"""
+        best = None
+        for (cached_query, cached_tabs), results in self._narrow_cache.items():
+            if cached_query not in query:
+                continue
+            if cached_tabs is not None and (tabs is None or not set(tabs) <= set(cached_tabs)):
+                continue
+            if best is None or len(cached_query) > len(best[0]):
+                best = (cached_query, results)
+        return best[1] if best is not None else None
+
+    def candidates(self, query, exact=False):
+        """Return the set of topics that may contain the query, or None if every topic may"""
+        self.ready.wait()
+        with self._lock:
+            return self._candidates(normalize_search_text(query), exact)
+
+    def _candidates(self, query, exact):
+        tokens = list(TOKEN_RE.finditer(query))
+        if not tokens:
+            return None
+
+        result = None
+        for match in tokens:
+            token = match.group()
+            # A token touching a non-word character of the query must start/end a term
+            left_bound = exact or match.start() > 0
+            right_bound = exact or match.end() < len(query)
+            topics = set()
+            for term in self._matching_terms(token, left_bound, right_bound):
+                topics.update(self.postings[term])
+            result = topics if result is None else result & topics
+            if not result:
+                break
+        return result
+
+    # --- Internal helpers ---
+    def _add_topic(self, tab_name, title, item_data):
+        key = (tab_name, title)
+        if key not in self.order:
+            self.order[key] = self._next_seq
+            self._next_seq += 1
+        self.items[key] = item_data
+
+        terms = set()
+        # Field texts are sliced out of the search text on demand instead of being kept twice
+        text, bounds, offset_maps = fold_topic_fields(title, item_data)
+        for field, lowered, _ in slice_fields(text, bounds, offset_maps):
+            for match in TOKEN_RE.finditer(lowered):
+                term = match.group()
+                hits = self.postings.get(term)
+                if hits is None:
+                    hits = self.postings[term] = {}
+                    for gram in term_trigrams(term):
+                        self.trigrams.setdefault(gram, set()).add(term)
+                hits.setdefault(key, []).append((field, match.start()))
+                terms.add(term)
+        self.topic_terms[key] = terms
+        self.search_texts[key] = text
+        self.field_bounds[key] = bounds
+        self.offset_maps[key] = offset_maps
+
+    def _remove_topic(self, tab_name, title):
+        key = (tab_name, title)
+        for term in self.topic_terms.pop(key, ()):
+            hits = self.postings.get(term)
+            if hits is None:
+                continue
+            hits.pop(key, None)
+            if not hits:
+                del self.postings[term]
+                for gram in term_trigrams(term):
+                    grams = self.trigrams.get(gram)
+                    if grams is not None:
+                        grams.discard(term)
+                        if not grams:
+                            del self.trigrams[gram]
+        self.search_texts.pop(key, None)
+        self.field_bounds.pop(key, None)
+        self.offset_maps.pop(key, None)
+        self.items.pop(key, None)
+
+    def _fuzzy_terms(self, token):
+        """{term: edit distance} for the terms within the token's typo budget.
+        Candidates share enough trigrams with the token (one edit changes at most three)."""
+        max_edits = fuzzy_max_edits(token)
+        if max_edits == 0:
+            return {token: 0} if token in self.postings else {}
+        grams = term_trigrams(token)
+        shared = {}
+        for gram in grams:
+            for term in self.trigrams.get(gram, ()):
+                shared[term] = shared.get(term, 0) + 1
+        min_shared = max(1, len(grams) - 3 * max_edits)
+        found = {}
+        for term, count in shared.items():
+            if count >= min_shared:
+                distance = edit_distance(token, term, max_edits)
+                if distance <= max_edits:
+                    found[term] = distance
+        return found
+
+    def _term_spans(self, key, terms):
+        """{field: spans} of the given terms in one topic, from the posting lists"""
+        offsets = {}
+        for term in set(terms):
+            for field, offset in self.postings[term][key]:
+                offsets.setdefault(field, []).append((offset, len(term)))
+        return {field: offsets_to_spans(text, sorted(offsets[field]), offset_map)
+                for field, text, offset_map in self._field_texts(key) if field in offsets}
+
+    def _match_spans(self, key, query, pattern=None):
+        """{field: spans} of every occurrence of the query in one topic"""
+        return field_match_spans(self._field_texts(key), query, pattern)
+
+    def _field_texts(self, key):
+        """(field, normalized text, offset map or None) of one topic, sliced from its search text"""
+        return slice_fields(self.search_texts[key], self.field_bounds[key], self.offset_maps[key])
+
+    def _matching_terms(self, token, left_bound, right_bound):
+        """Terms equal to / starting with / ending with / containing the token"""
+        if left_bound and right_bound:
+            return [token] if token in self.postings else []
+        if self._vocab is None:
+            self._vocab = sorted(self.postings)
+            self._vocab_reversed = sorted(term[::-1] for term in self.postings)
+        if left_bound:
+            return self._prefix_range(self._vocab, token)
+        if right_bound:
+            return [term[::-1] for term in self._prefix_range(self._vocab_reversed, token[::-1])]
+        return [term for term in self._vocab if token in term]
+
+    @staticmethod
+    def _prefix_range(sorted_terms, prefix):
+        start = bisect.bisect_left(sorted_terms, prefix)
+        end = bisect.bisect_left(sorted_terms, prefix + "\U0010ffff")
+        return sorted_terms[start:end]
+
+
+# ============ IOS COMMAND INDEX ============
+# "R1(config-if)# ip ospf cost 10" -> device, mode, prompt character, command
+COMMAND_LINE_RE = re.compile(r"^\s*([A-Za-z][\w.-]*)(?:\(([\w-]+)\))?([#>])[ \t]*(\S.*?)\s*$")
+COMMAND_FIELDS = ("code", "verification")
+# "mode:config-router cmd:network" -> catalog filters
+CATALOG_FILTER_RE = re.compile(r"(?:^|\s)(mode|cmd):\s*(.*?)(?=\s+(?:mode|cmd):|$)")
+CatalogEntry = namedtuple("CatalogEntry", "mode command devices uses")
+
+
+def parse_command_line(line):
+    """(device, mode, command) of an IOS prompt line, or None for any other line.
+    Modes are the prompt's parenthesised part, or 'exec' ('#') / 'user' ('>')."""
+    match = COMMAND_LINE_RE.match(line)
+    if not match:
+        return None
+    device, mode, prompt, command = match.groups()
+    command = re.sub(r"\s+!.*$", "", command)   # trailing "! comment"
+    if mode is None:
+        mode = "exec" if prompt == "#" else "user"
+    return device, mode, command
+
+
+def parse_topic_commands(item_data):
+    """[(field, line, device, mode, tokens, token spans)] for every command line of a topic"""
+    entries = []
+    for field in COMMAND_FIELDS:
+        for line_no, line in enumerate(item_data.get(field, '').split('\n'), 1):
+            parsed = parse_command_line(line)
+            if parsed is None:
+                continue
+            device, mode, command = parsed
+            offset = line.index(command)
+            words = list(re.finditer(r"\S+", command))
+            tokens = tuple(word.group().lower() for word in words)
+            token_spans = tuple((offset + word.start(), offset + word.end()) for word in words)
+            entries.append((field, line_no, device, mode, tokens, token_spans))
+    return entries
+
+
+def parse_catalog_query(query):
+    """(mode, command) filters of a 'mode:... cmd:...' query, or None for a plain text query"""
+    filters = dict(CATALOG_FILTER_RE.findall(query.lower()))
+    if not filters:
+        return None
+    mode = filters.get("mode", "").split()
+    return (mode[0] if mode else None), filters.get("cmd", "")
+
+
+def file_digest(paths):
+    """SHA-256 of the content of the given files (missing files are skipped)"""
+    digest = hashlib.sha256()
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class TrieNode:
+    __slots__ = ("children", "names", "topics")
+
+    def __init__(self):
+        self.children = {}      # token -> TrieNode
+        self.names = []         # sorted child tokens (prefix lookups by bisect)
+        self.topics = {}        # (tab, title) -> commands of that topic through this node
+
+
+class CommandIndex:
+    """Prefix trie of the IOS commands found in code/verification fields, one
+    trie per configuration mode. Abbreviated queries ("sh ip int br") are
+    resolved token by token like IOS does: an exact token or a unique prefix
+    among the commands valid at that point.
+
+    The parsed commands are cached in a JSON file keyed on the database hash,
+    so an unchanged database is not parsed again (nor, with SQLite, read)."""
+
+    def __init__(self):
+        self.roots = {}         # mode -> TrieNode
+        # (tab, title) -> [(field, line, device, mode, tokens, token spans)]
+        self.commands = {}
+        self.order = {}
+        self._next_seq = 0
+        self._catalog = None
+        self._lock = threading.Lock()
+        self.ready = threading.Event()
+
+    def build(self, data, cache_file=None, source_hash=None):
+        """Index every topic ({tab: {title: topic}} or its topic_list()), from the
+        cache file when it matches source_hash. ready is set even if this fails."""
+        topics = data if isinstance(data, list) else topic_list(data)
+        try:
+            cached = self.load_cache(cache_file, source_hash) if cache_file else None
+            with self._lock:
+                self.roots = {}
+                self.commands = {}
+                self.order = {}
+                self._next_seq = 0
+                for tab_name, title, item_data in topics:
+                    entries = cached.get((tab_name, title)) if cached is not None else None
+                    if entries is None:
+                        entries = parse_topic_commands(item_data)
+                    self._add_entries((tab_name, title), entries)
+        finally:
+            self.ready.set()
+        if cache_file and cached is None:
+            self.save_cache(cache_file, source_hash)
+
+    def update_topic(self, tab_name, title, item_data):
+        self.ready.wait()
+        with self._lock:
+            self._remove_topic(tab_name, title)
+            self._add_entries((tab_name, title), parse_topic_commands(item_data))
+
+    def remove_topic(self, tab_name, title):
+        self.ready.wait()
+        with self._lock:
+            self._remove_topic(tab_name, title)
+            self.order.pop((tab_name, title), None)
+
+    # --- Cache file ---
+    def load_cache(self, cache_file, source_hash):
+        """{(tab, title): entries} from the cache file, or None if missing or stale"""
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get("version") != COMMAND_CACHE_VERSION or cache.get("hash") != source_hash:
+                return None
+            return {(tab_name, title): [(field, line_no, device, mode, tuple(tokens),
+                                         tuple(tuple(span) for span in token_spans))
+                                        for field, line_no, device, mode, tokens, token_spans in entries]
+                    for tab_name, title, entries in cache["topics"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save_cache(self, cache_file, source_hash):
+        """Write the parsed commands for the database content identified by source_hash"""
+        with self._lock:
+            topics = [[key[0], key[1], self.commands[key]]
+                      for key in sorted(self.commands, key=self.order.__getitem__)]
+        try:
+            tmp_file = cache_file + ".tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({"version": COMMAND_CACHE_VERSION, "hash": source_hash, "topics": topics},
+                          f, ensure_ascii=False)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Error saving command cache: {e}")
+
+    # --- Queries ---
+    def resolve(self, query):
+        """[(mode, expanded tokens)] for every mode where the abbreviated query is unambiguous"""
+        tokens = query.lower().split()
+        if not tokens:
+            return []
+        self.ready.wait()
+        with self._lock:
+            return [(mode, path) for mode, (node, path) in self._resolve_modes(self.roots, tokens).items()]
+
+    def search(self, query, tabs=None, with_spans=False):
+        """Topics containing a command the query abbreviates, in database order
+        (SearchMatches with the matching command spans if with_spans is set)"""
+        tokens = query.lower().split()
+        if not tokens:
+            return []
+        self.ready.wait()
+        with self._lock:
+            return self._matches(self._resolve_modes(self.roots, tokens), tabs, with_spans)
+
+    def catalog_search(self, mode=None, command="", tabs=None, with_spans=False):
+        """Topics with a command valid in mode (any mode if None) that starts with
+        the (possibly abbreviated) command tokens; spans cover those commands"""
+        self.ready.wait()
+        with self._lock:
+            roots = self.roots if mode is None else {mode: self.roots[mode]} if mode in self.roots else {}
+            return self._matches(self._resolve_modes(roots, command.lower().split()), tabs, with_spans)
+
+    def catalog(self, mode=None):
+        """Deduplicated CatalogEntries (mode, normalized command, devices, uses), sorted"""
+        self.ready.wait()
+        with self._lock:
+            if self._catalog is None:
+                catalog = {}
+                for key in sorted(self.commands, key=self.order.__getitem__):
+                    for field, line_no, device, entry_mode, tokens, _ in self.commands[key]:
+                        entry = catalog.setdefault((entry_mode, " ".join(tokens)), (set(), []))
+                        entry[0].add(device)
+                        entry[1].append((key[0], key[1], field, line_no))
+                self._catalog = [CatalogEntry(entry_mode, command, tuple(sorted(devices)), uses)
+                                 for (entry_mode, command), (devices, uses) in sorted(catalog.items())]
+            return [entry for entry in self._catalog if mode is None or entry.mode == mode]
+
+    # --- Internal helpers ---
+    def _resolve_modes(self, roots, tokens):
+        """{mode: (node, expanded path)} for the modes where every token resolves"""
+        resolved = {}
+        for mode, root in roots.items():
+            node, path = root, []
+            for token in tokens:
+                child = node.children.get(token)
+                if child is None:
+                    start = bisect.bisect_left(node.names, token)
+                    end = bisect.bisect_left(node.names, token + "\U0010ffff")
+                    if end - start != 1:
+                        break   # unknown or ambiguous in this mode
+                    token = node.names[start]
+                    child = node.children[token]
+                node = child
+                path.append(token)
+            else:
+                resolved[mode] = (node, tuple(path))
+        return resolved
+
+    def _matches(self, resolved, tabs, with_spans):
+        found = {}      # (tab, title) -> [(mode, path)]
+        for mode, (node, path) in resolved.items():
+            # The root has no topic counts: every command of the mode goes through one of its children
+            topics = node.topics if path else {key for child in node.children.values() for key in child.topics}
+            for key in topics:
+                if tabs is None or key[0] in tabs:
+                    found.setdefault(key, []).append((mode, path))
+        keys = sorted(found, key=self.order.__getitem__)
+        if not with_spans:
+            return keys
+        return [SearchMatch(key[0], key[1], self._spans(key, found[key])) for key in keys]
+
+    def _spans(self, key, resolved):
+        spans = {}
+        for field, line_no, _, mode, tokens, token_spans in self.commands.get(key, ()):
+            for resolved_mode, path in resolved:
+                if mode == resolved_mode and tokens[:len(path)] == path:
+                    # An empty path (mode filter only) covers the whole command
+                    start, end = token_spans[0][0], token_spans[len(path) - 1][1]
+                    spans.setdefault(field, []).append((line_no, start, end - start))
+                    break
+        return spans
+
+    def _add_entries(self, key, entries):
+        if key not in self.order:
+            self.order[key] = self._next_seq
+            self._next_seq += 1
+        for _, _, _, mode, tokens, _ in entries:
+            node = self.roots.setdefault(mode, TrieNode())
+            for token in tokens:
+                child = node.children.get(token)
+                if child is None:
+                    child = node.children[token] = TrieNode()
+                    bisect.insort(node.names, token)
+                node = child
+                node.topics[key] = node.topics.get(key, 0) + 1
+        self.commands[key] = entries
+        self._catalog = None
+
+    def _remove_topic(self, tab_name, title):
+        key = (tab_name, title)
+        for _, _, _, mode, tokens, _ in self.commands.pop(key, ()):
+            node = self.roots.get(mode)
+            for token in tokens:
+                child = node.children[token]
+                child.topics[key] -= 1
+                if not child.topics[key]:
+                    del child.topics[key]
+                if not child.topics:
+                    # No command goes through this token any more: prune the branch
+                    del node.children[token]
+                    node.names.remove(token)
+                    break
+                node = child
+        self._catalog = None
+
+
+def merge_matches(matches, extra):
+    """Append the results of another matcher that are not already listed"""
+    listed = {(match[0], match[1]) for match in matches}
+    return matches + [match for match in extra if (match[0], match[1]) not in listed]
+
+
+# ============ PERSISTENCE ============
+def apply_journal_entry(data, entry):
+    """Apply one journal entry (per-topic upsert or delete) to the database dict"""
+    if entry["op"] == "upsert":
+        data.setdefault(entry["tab"], {})[entry["title"]] = entry["item"]
+    elif entry["op"] == "delete":
+        data.get(entry["tab"], {}).pop(entry["title"], None)
+
+
+def snapshot_data(data):
+    """Copy the dict structure (not the strings) so it can be written from another thread"""
+    return {tab_name: {title: dict(item_data) for title, item_data in tab_data.items()}
+            for tab_name, tab_data in data.items()}
+
+
+class JsonStore:
+    """JSON database file plus an append-only journal of per-topic changes.
+
+    Edits only append one line to the journal. The journal is folded into the
+    main file (compaction) in a background thread once it grows, and on exit.
+    The main file is always replaced atomically (temp file + rename)."""
+
+    def __init__(self, db_file, compact_bytes=JOURNAL_COMPACT_BYTES):
+        self.db_file = db_file
+        self.journal_file = db_file + ".journal"
+        # Journal being compacted; replayed before the live journal if a compaction was interrupted
+        self.rotated_file = db_file + ".journal.old"
+        self.compact_bytes = compact_bytes
+        self._lock = threading.Lock()
+        self._compact_thread = None
+        self._torn_tail = False
+
+    def exists(self):
+        return os.path.exists(self.db_file)
+
+    def content_hash(self):
+        """Digest of the files whose content together is the database (keys derived caches)"""
+        return file_digest((self.db_file, self.rotated_file, self.journal_file))
+
+    def load(self):
+        """Read the database file and replay the journal on top of it"""
+        with open(self.db_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.replay(data)
+        return data
+
+    def replay(self, data):
+        """Apply journal entries written since the last compaction"""
+        for path in (self.rotated_file, self.journal_file):
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.endswith("\n") and path == self.journal_file:
+                        self._torn_tail = True  # next append must start on a new line
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # blank line or torn line of a crashed write
+                    apply_journal_entry(data, entry)
+
+    def save_topic(self, tab_name, title, item_data):
+        """Journal the new content of one topic"""
+        self.save_topics({(tab_name, title): item_data})
+
+    def delete_topic(self, tab_name, title):
+        """Journal the removal of one topic"""
+        self.save_topics({(tab_name, title): None})
+
+    def save_topics(self, changes):
+        """Journal a batch of {(tab, title): item or None for delete} with one write and fsync"""
+        lines = []
+        for (tab_name, title), item_data in changes.items():
+            if item_data is None:
+                entry = {"op": "delete", "tab": tab_name, "title": title}
+            else:
+                entry = {"op": "upsert", "tab": tab_name, "title": title, "item": item_data}
+            lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+        if self._torn_tail:
+            lines.insert(0, "\n")
+            self._torn_tail = False
+        with self._lock:
+            with open(self.journal_file, 'a', encoding='utf-8') as f:
+                f.write("".join(lines))
+                f.flush()
+                os.fsync(f.fileno())
+
+    def needs_compaction(self):
+        try:
+            return os.path.getsize(self.journal_file) >= self.compact_bytes
+        except OSError:
+            return False
+
+    def write_all(self, data):
+        """Atomically replace the database file"""
+        tmp_file = self.db_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.db_file)
+
+    def save_all(self, data):
+        """Replace the whole database (pending journal entries are discarded)"""
+        with self._lock:
+            self.write_all(data)
+            for path in (self.journal_file, self.rotated_file):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def compact(self, data, background=True):
+        """Fold the journal into the database file"""
+        if self._compact_thread is not None and self._compact_thread.is_alive():
+            if background:
+                return
+            self._compact_thread.join()
+
+        # Rotate the journal and snapshot the data together, so edits made while
+        # the snapshot is written go to a fresh journal and are never lost
+        with self._lock:
+            if not os.path.exists(self.journal_file) and not os.path.exists(self.rotated_file):
+                return
+            if os.path.exists(self.journal_file):
+                if os.path.exists(self.rotated_file):
+                    # An interrupted compaction left entries behind: keep them in order
+                    with open(self.journal_file, 'r', encoding='utf-8') as src, \
+                         open(self.rotated_file, 'a', encoding='utf-8') as dst:
+                        dst.write("\n" + src.read())
+                    os.remove(self.journal_file)
+                else:
+                    os.replace(self.journal_file, self.rotated_file)
+            snapshot = snapshot_data(data)
+
+        if background:
+            self._compact_thread = threading.Thread(target=self._write_compacted, args=(snapshot,),
+                                                    name="db-compact")
+            self._compact_thread.start()
+        else:
+            self._write_compacted(snapshot)
+
+    def _write_compacted(self, snapshot):
+        try:
+            self.write_all(snapshot)
+            os.remove(self.rotated_file)
+        except Exception as e:
+            print(f"Error compacting database: {e}")
+
+
+def topic_line_counts(item_data):
+    """(code lines, verification lines or None if empty, notes lines) used to size a card"""
+    line_counts = getattr(item_data, "line_counts", None)
+    if line_counts is not None:
+        return line_counts
+    verification = item_data.get('verification', '')
+    return (item_data['code'].count('\n'),
+            verification.count('\n') if verification.strip() else None,
+            item_data.get('notes', NOTES_PLACEHOLDER).count('\n'))
+
+
+class LazyTopic(MutableMapping):
+    """Topic record of a SQLiteStore: its text fields are fetched on first access.
+    line_counts is known up front so cards can be sized without the text."""
+
+    def __init__(self, store, row_id, line_counts):
+        self.store = store
+        self.row_id = row_id
+        self.line_counts = line_counts
+        self._fields = None     # set once the topic is edited (kept in memory from then on)
+
+    def _get_fields(self):
+        if self._fields is not None:
+            return self._fields
+        return self.store.fetch_fields(self.row_id)
+
+    def __getitem__(self, key):
+        return self._get_fields()[key]
+
+    def __setitem__(self, key, value):
+        if self._fields is None:
+            self._fields = dict(self.store.fetch_fields(self.row_id))
+        self._fields[key] = value
+        self.line_counts = None
+
+    def __delitem__(self, key):
+        if self._fields is None:
+            self._fields = dict(self.store.fetch_fields(self.row_id))
+        del self._fields[key]
+        self.line_counts = None
+
+    def __iter__(self):
+        return iter(self._get_fields())
+
+    def __len__(self):
+        return len(self._get_fields())
+
+
+class SQLiteStore:
+    """SQLite database: topic metadata (tab, title, line counts) is loaded up
+    front, the code/verification/example/notes bodies on demand through a
+    small LRU cache. Writes are per-topic upserts in SQLite transactions.
+
+    Each row carries the topic_hash() of its searchable text, so the search
+    index kept in the same file (SQLiteSearchIndex) only re-reads the topics
+    that changed since it was last built."""
+
+    BODY_FIELDS = ("code", "verification", "example", "notes")
+
+    def __init__(self, db_file, cache_size=BODY_CACHE_SIZE):
+        self.db_file = db_file
+        self.cache_size = cache_size
+        self._cache = OrderedDict()     # row id -> fields dict
+        self._lock = threading.RLock()
+        self._conn = None
+
+    def exists(self):
+        return os.path.exists(self.db_file)
+
+    def content_hash(self):
+        """Digest of every topic key, position and text hash (the file itself also
+        holds the search index, so its bytes change without the topics changing)"""
+        digest = hashlib.sha256()
+        with self._lock:
+            rows = self.connect().execute("SELECT tab, title, position, source_hash FROM topics ORDER BY id")
+            for row in rows:
+                digest.update(json.dumps(row, ensure_ascii=False).encode("utf-8"))
+        return digest.hexdigest()
+
+    def connect(self):
+        if self._conn is None:
+            # Shared by the Tk thread, the search worker and the save worker (guarded by _lock)
+            self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            self._conn.execute("""CREATE TABLE IF NOT EXISTS topics (
+                id INTEGER PRIMARY KEY,
+                tab TEXT NOT NULL,
+                title TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                code_lines INTEGER NOT NULL,
+                verification_lines INTEGER,
+                notes_lines INTEGER NOT NULL,
+                code TEXT NOT NULL,
+                verification TEXT,
+                example TEXT,
+                notes TEXT,
+                extra TEXT,
+                source_hash TEXT,
+                UNIQUE (tab, title))""")
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(topics)")]
+            if "source_hash" not in columns:
+                self._add_source_hashes()
+        return self._conn
+
+    def _add_source_hashes(self):
+        """Upgrade a database written before topics carried a source_hash"""
+        with self._conn:
+            self._conn.execute("ALTER TABLE topics ADD COLUMN source_hash TEXT")
+            rows = self._conn.execute("SELECT id, title, code, verification, example, notes FROM topics").fetchall()
+            self._conn.executemany(
+                "UPDATE topics SET source_hash = ? WHERE id = ?",
+                [(topic_hash(row[1], {key: value for key, value in zip(self.BODY_FIELDS, row[2:]) if value is not None}),
+                  row[0]) for row in rows])
+
+    def load(self):
+        """Return {tab: {title: LazyTopic}} without reading any topic body"""
+        with self._lock:
+            rows = self.connect().execute(
+                "SELECT id, tab, title, code_lines, verification_lines, notes_lines "
+                "FROM topics ORDER BY position").fetchall()
+        data = {}
+        for row_id, tab_name, title, code_lines, verification_lines, notes_lines in rows:
+            data.setdefault(tab_name, {})[title] = LazyTopic(self, row_id, (code_lines, verification_lines, notes_lines))
+        return data
+
+    def fetch_fields(self, row_id):
+        """Text fields of one topic (missing fields are left out, like in the JSON file)"""
+        with self._lock:
+            fields = self._cache.get(row_id)
+            if fields is not None:
+                self._cache.move_to_end(row_id)
+                return fields
+            row = self.connect().execute(
+                "SELECT code, verification, example, notes, extra FROM topics WHERE id = ?", (row_id,)).fetchone()
+            fields = {key: value for key, value in zip(self.BODY_FIELDS, row) if value is not None}
+            if row[4]:
+                fields.update(json.loads(row[4]))
+            self._cache[row_id] = fields
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return fields
+
+    def save_all(self, data):
+        """Replace the whole database in one transaction"""
+        rows = [(tab_name, title, dict(item_data))
+                for tab_name, tab_data in data.items() for title, item_data in tab_data.items()]
+        with self._lock:
+            conn = self.connect()
+            with conn:
+                conn.execute("DELETE FROM topics")
+                for position, (tab_name, title, item_data) in enumerate(rows):
+                    self._insert(conn, tab_name, title, item_data, position)
+            self._cache.clear()
+
+    def save_topics(self, changes):
+        """Upsert/delete a batch of {(tab, title): item or None} in one transaction"""
+        with self._lock:
+            conn = self.connect()
+            with conn:
+                for (tab_name, title), item_data in changes.items():
+                    row = conn.execute("SELECT id, position FROM topics WHERE tab = ? AND title = ?",
+                                       (tab_name, title)).fetchone()
+                    if row is not None:
+                        conn.execute("DELETE FROM topics WHERE id = ?", (row[0],))
+                        self._cache.pop(row[0], None)
+                    if item_data is None:
+                        continue
+                    if row is not None:
+                        position = row[1]
+                    else:
+                        position = conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM topics").fetchone()[0]
+                    row_id = self._insert(conn, tab_name, title, item_data, position, row[0] if row else None)
+                    self._cache.pop(row_id, None)
+
+    def save_topic(self, tab_name, title, item_data):
+        self.save_topics({(tab_name, title): item_data})
+
+    def delete_topic(self, tab_name, title):
+        self.save_topics({(tab_name, title): None})
+
+    def _insert(self, conn, tab_name, title, item_data, position, row_id=None):
+        code_lines, verification_lines, notes_lines = topic_line_counts(item_data)
+        extra = {key: value for key, value in item_data.items() if key not in self.BODY_FIELDS}
+        cursor = conn.execute(
+            "INSERT INTO topics (id, tab, title, position, code_lines, verification_lines, notes_lines, "
+            "code, verification, example, notes, extra, source_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (row_id, tab_name, title, position, code_lines, verification_lines, notes_lines,
+             item_data['code'], item_data.get('verification'), item_data.get('example'),
+             item_data.get('notes'), json.dumps(extra, ensure_ascii=False) if extra else None,
+             topic_hash(title, item_data)))
+        return cursor.lastrowid
+
+    # SQLite already writes incrementally and atomically: nothing to compact
+    def needs_compaction(self):
+        return False
+
+    def compact(self, data, background=True):
+        pass
+
+
+def open_store(db_file):
+    """Pick the storage backend from the database file name"""
+    if db_file.endswith(SQLITE_SUFFIXES):
+        return SQLiteStore(db_file)
+    return JsonStore(db_file)
+
+
+# ============ RANKED SEARCH (SQLite FTS5) ============
+SearchHit = namedtuple("SearchHit", "tab title score snippet highlights")
+
+
+def fts_phrase(query):
+    """FTS5 phrase for a folded query (a substring query with the trigram tokenizer)"""
+    return '"' + query.replace('"', '""') + '"'
+
+
+def make_snippet(text, query, start, exact_pattern=None, radius=SNIPPET_RADIUS, raw=False):
+    """One-line excerpt around a match plus the (offset, length) of every match inside it
+    (raw: the query is matched against the unfolded text, see raw_match_spans)"""
+    begin = max(0, start - radius)
+    end = min(len(text), start + len(query) + radius)
+    excerpt = text[begin:end].replace('\n', ' ')
+    prefix = "…" if begin > 0 else ""
+    snippet = prefix + excerpt + ("…" if end < len(text) else "")
+
+    folded, offset_map = (excerpt.lower(), None) if raw else fold_search_text(excerpt)
+    spans = unfold_offsets(find_offsets(folded, query, exact_pattern), offset_map)
+    return snippet, [(offset + len(prefix), length) for offset, length in spans]
+
+
+def ranked_hits(rows, query, exact, raw, tabs, is_cancelled, item_of, unfold):
+    """SearchHits of the FTS candidate rows (tab, title, score, folded text, ref)
+    that really contain the query, with a snippet of the original text.
+    item_of(tab, title) returns the topic (None if it is gone) and
+    unfold(ref, offset, title, item) maps an offset of the folded text back
+    to topic_search_text; with raw, the unfolded text is scanned instead."""
+    pattern = word_pattern(query) if exact else None
+    hits = []
+    for i, (tab_name, title, score, folded, ref) in enumerate(rows):
+        if is_cancelled is not None and i % 64 == 0 and is_cancelled():
+            raise SearchCancelled()
+        if tabs is not None and tab_name not in tabs:
+            continue
+        item_data = item_of(tab_name, title)
+        if item_data is None:
+            continue
+        body = None
+        if raw:
+            body = topic_search_text(title, item_data)
+            folded = body.lower()
+        if pattern is not None:
+            match = pattern.search(folded)
+            if not match:
+                continue
+            start = match.start()
+        else:
+            start = folded.find(query)
+            if start == -1:
+                continue
+        # Snippets show the original text (built for verified hits only)
+        if body is None:
+            start = unfold(ref, start, title, item_data)
+            body = topic_search_text(title, item_data)
+        snippet, highlights = make_snippet(body, query, start, pattern, raw=raw)
+        hits.append(SearchHit(tab_name, title, score, snippet, highlights))
+    return hits
+
+
+class FTSSearchEngine:
+    """Optional ranked search over every topic field with SQLite FTS5.
+
+    The table holds the folded text (normalize_search_text), and the trigram
+    tokenizer makes a quoted FTS5 phrase a substring query, so candidates
+    match the same way as SearchIndex; each candidate is then verified
+    (substring or word-boundary for Exact Match) and results come back
+    ordered by BM25, with a snippet of the original text and highlight
+    offsets. The in-memory table is built on the first ranked query."""
+
+    def __init__(self, data):
+        self.data = data
+        self._conn = None
+        self._lock = threading.Lock()
+        self.rowids = {}        # (tab, title) -> FTS rowid
+        self.offset_maps = {}   # rowid -> fold offset map of the body, when folding is not 1:1
+        self._next_rowid = 1
+
+    @staticmethod
+    def available():
+        """True if this Python's SQLite has FTS5 with the trigram tokenizer"""
+        try:
+            conn = sqlite3.connect(":memory:")
+            conn.execute("CREATE VIRTUAL TABLE probe USING fts5(body, tokenize='trigram')")
+            conn.close()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def update_topic(self, tab_name, title, item_data):
+        """Re-index one topic (no-op until the table has been built)"""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._delete(tab_name, title)
+            self._insert(tab_name, title, item_data)
+
+    def remove_topic(self, tab_name, title):
+        with self._lock:
+            if self._conn is not None:
+                self._delete(tab_name, title)
+
+    def search(self, query, exact=False, tabs=None, is_cancelled=None):
+        """Return SearchHits ranked by BM25 (best first)"""
+        folded = normalize_search_text(query)
+        # Only emoji/symbols, which folding drops: scan the unfolded text instead
+        raw = not folded.strip()
+        query = query.lower() if raw else folded
+        with self._lock:
+            self._ensure_built()
+            if len(query) >= 3 and not raw:
+                # Title hits weigh more than body hits (tab and title are unindexed keys)
+                rows = self._conn.execute(
+                    "SELECT tab, title, bm25(topics, 0.0, 0.0, 5.0, 1.0), body, rowid FROM topics "
+                    "WHERE topics MATCH ? ORDER BY 3", (fts_phrase(query),)).fetchall()
+            else:
+                # Too short for trigrams: plain scan, database order
+                rows = self._conn.execute("SELECT tab, title, 0.0, body, rowid FROM topics "
+                                          "ORDER BY rowid").fetchall()
+            offset_maps = self.offset_maps
+
+        def unfold(rowid, offset, title, item_data):
+            offset_map = offset_maps.get(rowid)
+            return offset_map[offset] if offset_map is not None else offset
+
+        return ranked_hits(rows, query, exact, raw, tabs, is_cancelled,
+                           lambda tab_name, title: self.data.get(tab_name, {}).get(title), unfold)
+
+    # --- Internal helpers ---
+    def _ensure_built(self):
+        """Fill the table on first use. self._conn is only set once it is complete,
+        so a failed build is tried again by the next ranked query."""
+        if self._conn is not None:
+            return
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        try:
+            # name and body are folded; tab and title are the topic key
+            conn.execute("CREATE VIRTUAL TABLE topics USING fts5(tab UNINDEXED, title UNINDEXED, name, body, "
+                         "tokenize='trigram')")
+            self.rowids = {}
+            self.offset_maps = {}
+            self._next_rowid = 1
+            with conn:
+                for tab_name, title, item_data in topic_list(self.data):
+                    self._insert(tab_name, title, item_data, conn)
+        except Exception:
+            conn.close()
+            raise
+        self._conn = conn
+
+    def _insert(self, tab_name, title, item_data, conn=None):
+        rowid = self.rowids.get((tab_name, title))
+        if rowid is None:
+            rowid = self.rowids[(tab_name, title)] = self._next_rowid
+            self._next_rowid += 1
+        # The offset map is kept so a query never refolds a body for its snippet
+        folded, offset_map = fold_search_text(topic_search_text(title, item_data))
+        if offset_map is not None:
+            self.offset_maps[rowid] = offset_map
+        (conn or self._conn).execute(
+            "INSERT INTO topics (rowid, tab, title, name, body) VALUES (?, ?, ?, ?, ?)",
+            (rowid, tab_name, title, normalize_search_text(title), folded))
+
+    def _delete(self, tab_name, title):
+        rowid = self.rowids.get((tab_name, title))
+        if rowid is not None:
+            self._conn.execute("DELETE FROM topics WHERE rowid = ?", (rowid,))
+            self.offset_maps.pop(rowid, None)
+
+
+# ============ ON-DISK SEARCH INDEX (SQLite) ============
+def pack_offset_maps(offset_maps):
+    """{field: offset map} as a compressed blob (None if empty): a JSON line of
+    {field: map length}, then every map as little-endian 32-bit integers"""
+    if not offset_maps:
+        return None
+    offsets = array.array("I")
+    for offset_map in offset_maps.values():
+        offsets.extend(offset_map)
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    header = json.dumps({field: len(offset_map) for field, offset_map in offset_maps.items()})
+    return zlib.compress(header.encode("utf-8") + b"\n" + offsets.tobytes())
+
+
+def unpack_offset_maps(blob):
+    if blob is None:
+        return {}
+    header, _, data = zlib.decompress(blob).partition(b"\n")
+    offsets = array.array("I")
+    offsets.frombytes(data)
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    offset_maps = {}
+    start = 0
+    for field, length in json.loads(header).items():
+        offset_maps[field] = offsets[start:start + length].tolist()
+        start += length
+    return offset_maps
+
+
+def unfold_topic_offset(offset, bounds, offset_maps, title, item_data):
+    """Offset in topic_search_text() of an offset in the fold_topic_fields() text"""
+    raw_start = 0
+    for field, start, end in bounds:
+        raw = title if field == "title" else item_data.get(field, '')
+        if offset <= end:
+            pos = offset - start
+            offset_map = offset_maps.get(field)
+            if offset_map is not None:
+                pos = offset_map[pos] if pos < len(offset_map) else len(raw)
+            return raw_start + pos
+        raw_start += len(raw) + 1
+    return raw_start
+
+
+class SQLiteSearchIndex:
+    """SearchIndex kept in tables of the SQLiteStore database instead of memory:
+    the folded text of each topic (search_topics), an FTS5 trigram index over
+    it (search_fts) and its terms (search_terms, for fuzzy matching). Only the
+    topic records (not copied) are held in memory, for the unfolded searches.
+
+    Each row records the topic_hash() it was folded from, so a build only
+    re-reads the topics saved since the last run. Edits are written through
+    at once, on the thread making them."""
+
+    SCHEMA = (
+        "CREATE TABLE search_meta (key TEXT PRIMARY KEY, value)",
+        # name is the folded title (weighted in ranked search), body the fold_topic_fields() text
+        """CREATE TABLE search_topics (
+            id INTEGER PRIMARY KEY,
+            tab TEXT NOT NULL,
+            title TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            source_hash TEXT NOT NULL,
+            name TEXT NOT NULL,
+            body TEXT NOT NULL,
+            bounds TEXT NOT NULL,
+            offset_maps BLOB,
+            UNIQUE (tab, title))""",
+        "CREATE INDEX search_topics_seq ON search_topics (seq)",
+        "CREATE VIRTUAL TABLE search_fts USING fts5(name, body, content='search_topics', content_rowid='id', "
+        "tokenize='trigram')",
+        # Rows are replaced, never updated (except seq), so inserts and deletes keep search_fts in step
+        "CREATE TRIGGER search_topics_ai AFTER INSERT ON search_topics BEGIN "
+        "INSERT INTO search_fts (rowid, name, body) VALUES (new.id, new.name, new.body); END",
+        "CREATE TRIGGER search_topics_ad AFTER DELETE ON search_topics BEGIN "
+        "INSERT INTO search_fts (search_fts, rowid, name, body) VALUES ('delete', old.id, old.name, old.body); END",
+        "CREATE TABLE search_terms (term TEXT NOT NULL, id INTEGER NOT NULL, PRIMARY KEY (term, id)) WITHOUT ROWID",
+        "CREATE INDEX search_terms_id ON search_terms (id)",
+    )
+    TABLES = ("search_fts", "search_terms", "search_topics", "search_meta")
+
+    def __init__(self, store):
+        self.store = store
+        # (tab, title) -> topic record (read only by the unfolded searches and ranked snippets)
+        self.items = {}
+        self.generation = next(index_generations)   # changes with every build/edit
+        # Searches run on a worker thread while edits happen on the Tk thread:
+        # every read and write goes through the store's connection and lock
+        self._lock = store._lock
+        self._schema_checked = False
+        # Set once the first build finished (the build runs in the background)
+        self.ready = threading.Event()
+
+    def build(self, data):
+        """Bring the tables up to date with every topic of the database ({tab: {title:
+        topic}} or its topic_list()). Only topics whose row in the store has another
+        hash than their search row are read and folded, a batch per transaction so
+        the store stays usable meanwhile. ready is set even if the build fails."""
+        topics = data if isinstance(data, list) else topic_list(data)
+        try:
+            with self._lock:
+                conn = self._connect()
+                fresh = {(tab_name, title): (row_id, seq) for tab_name, title, row_id, seq in conn.execute(
+                    "SELECT s.tab, s.title, s.id, s.seq FROM search_topics s JOIN topics t "
+                    "ON t.tab = s.tab AND t.title = s.title AND t.source_hash = s.source_hash")}
+                indexed = conn.execute("SELECT id, tab, title FROM search_topics").fetchall()
+            items = {}
+            stale = []
+            moved = []
+            for seq, (tab_name, title, item_data) in enumerate(topics):
+                items[(tab_name, title)] = item_data
+                row = fresh.get((tab_name, title))
+                if row is None:
+                    stale.append((seq, tab_name, title, item_data))
+                elif row[1] != seq:
+                    moved.append((seq, row[0]))
+            with self._lock:
+                with conn:
+                    for row_id, tab_name, title in indexed:
+                        if (tab_name, title) not in items:
+                            self._delete(conn, row_id)
+                    conn.executemany("UPDATE search_topics SET seq = ? WHERE id = ?", moved)
+                self.items = items
+            for start in range(0, len(stale), SEARCH_INDEX_BATCH):
+                # Folded outside the lock: reading a lazy topic body takes it too
+                rows = [(seq, tab_name, title, self._fold(title, item_data))
+                        for seq, tab_name, title, item_data in stale[start:start + SEARCH_INDEX_BATCH]]
+                with self._lock:
+                    with conn:
+                        for seq, tab_name, title, folded in rows:
+                            self._write(conn, tab_name, title, seq, folded)
+        finally:
+            self.generation = next(index_generations)
+            self.ready.set()
+
+    def update_topic(self, tab_name, title, item_data):
+        """Re-index one topic after it was added or edited"""
+        self.ready.wait()
+        folded = self._fold(title, item_data)
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT seq FROM search_topics WHERE tab = ? AND title = ?",
+                               (tab_name, title)).fetchone()
+            if row is None:
+                row = conn.execute("SELECT COALESCE(MAX(seq), -1) + 1 FROM search_topics").fetchone()
+            with conn:
+                self._write(conn, tab_name, title, row[0], folded)
+            self.items[(tab_name, title)] = item_data
+            self.generation = next(index_generations)
+
+    def remove_topic(self, tab_name, title):
+        """Drop one topic from the index"""
+        self.ready.wait()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT id FROM search_topics WHERE tab = ? AND title = ?",
+                               (tab_name, title)).fetchone()
+            if row is not None:
+                with conn:
+                    self._delete(conn, row[0])
+            self.items.pop((tab_name, title), None)
+            self.generation = next(index_generations)
+
+    def search(self, query, exact=False, tabs=None, is_cancelled=None, with_spans=False, fuzzy=False,
+               regex=False):
+        """Same results as SearchIndex.search (see there)"""
+        self.ready.wait()
+        if regex:
+            return self._regex_search(query, tabs, is_cancelled, with_spans)
+        folded = normalize_search_text(query)
+        if not folded.strip():
+            # Only emoji/symbols, which folding drops: a folded query would match everything
+            return self._raw_search(query.lower(), exact, tabs, is_cancelled, with_spans)
+        if fuzzy and not exact:
+            return self._fuzzy_search(folded, tabs, is_cancelled, with_spans)
+        return self._search(folded, exact, tabs, is_cancelled, with_spans)
+
+    def ranked_search(self, query, exact=False, tabs=None, is_cancelled=None):
+        """Same results as FTSSearchEngine.search, from the search_fts table"""
+        self.ready.wait()
+        folded = normalize_search_text(query)
+        # Only emoji/symbols, which folding drops: scan the unfolded text instead
+        raw = not folded.strip()
+        query = query.lower() if raw else folded
+        with self._lock:
+            conn = self._connect()
+            if len(query) >= 3 and not raw:
+                # Title hits weigh more than body hits
+                rows = conn.execute(
+                    "SELECT s.tab, s.title, bm25(search_fts, 5.0, 1.0), s.body, s.bounds, s.offset_maps "
+                    "FROM search_fts JOIN search_topics s ON s.id = search_fts.rowid "
+                    "WHERE search_fts MATCH ? ORDER BY 3", (fts_phrase(query),)).fetchall()
+            else:
+                # Too short for trigrams: plain scan, database order
+                rows = conn.execute("SELECT tab, title, 0.0, body, bounds, offset_maps FROM search_topics "
+                                    "ORDER BY seq").fetchall()
+
+        def unfold(ref, offset, title, item_data):
+            return unfold_topic_offset(offset, json.loads(ref[0]), unpack_offset_maps(ref[1]), title, item_data)
+
+        return ranked_hits([row[:4] + (row[4:],) for row in rows], query, exact, raw, tabs, is_cancelled,
+                           lambda tab_name, title: self.items.get((tab_name, title)), unfold)
+
+    def _search(self, query, exact, tabs, is_cancelled, with_spans=False):
+        pattern = word_pattern(query) if exact else None
+        columns = "tab, title, body, bounds, offset_maps" if exact or with_spans else "tab, title"
+        with self._lock:
+            rows = self._containing(self._connect(), query, columns)
+        results = []
+        for i, row in enumerate(rows):
+            if is_cancelled is not None and i % 64 == 0 and is_cancelled():
+                raise SearchCancelled()
+            if tabs is not None and row[0] not in tabs:
+                continue
+            if pattern is not None and not pattern.search(row[2]):
+                continue
+            if with_spans:
+                results.append(SearchMatch(row[0], row[1], field_match_spans(self._fields(*row[2:]), query, pattern)))
+            else:
+                results.append((row[0], row[1]))
+        return results
+
+    def _fuzzy_search(self, query, tabs, is_cancelled, with_spans):
+        """Substring matches first, then topics where every query token is within
+        fuzzy_max_edits of some term, ranked by the summed edit distance"""
+        substring_hits = set(self._search(query, False, tabs, is_cancelled))
+        scores = {key: 0 for key in substring_hits}
+        matched_terms = {}      # fuzzy-only topic -> terms that matched
+        topic_scores = None
+        with self._lock:
+            conn = self._connect()
+            order = {(tab_name, title): seq for tab_name, title, seq in
+                     conn.execute("SELECT tab, title, seq FROM search_topics")}
+            for token in TOKEN_RE.findall(query):
+                if is_cancelled is not None and is_cancelled():
+                    raise SearchCancelled()
+                best = {}
+                terms = {}
+                for term, distance in self._fuzzy_terms(conn, token).items():
+                    for tab_name, title in conn.execute(
+                            "SELECT s.tab, s.title FROM search_terms t JOIN search_topics s ON s.id = t.id "
+                            "WHERE t.term = ?", (term,)):
+                        key = (tab_name, title)
+                        if tabs is not None and tab_name not in tabs:
+                            continue
+                        if key not in best or distance < best[key]:
+                            best[key] = distance
+                        terms.setdefault(key, []).append(term)
+                if topic_scores is None:
+                    topic_scores = best
+                else:
+                    topic_scores = {key: score + best[key] for key, score in topic_scores.items() if key in best}
+                for key in topic_scores:
+                    matched_terms.setdefault(key, []).extend(terms[key])
+                if not topic_scores:
+                    break
+
+        for key, score in (topic_scores or {}).items():
+            scores.setdefault(key, score)
+        results = sorted(scores, key=lambda key: (scores[key], order[key]))
+        if not with_spans:
+            return results
+
+        matches = []
+        for key in results:
+            with self._lock:
+                fields = self._fields(*self._connect().execute(
+                    "SELECT body, bounds, offset_maps FROM search_topics WHERE tab = ? AND title = ?", key).fetchone())
+            if key in substring_hits:
+                spans = field_match_spans(fields, query)
+            else:
+                spans = field_term_spans(fields, set(matched_terms[key]))
+            matches.append(SearchMatch(key[0], key[1], spans))
+        return matches
+
+    def _raw_search(self, query, exact, tabs, is_cancelled, with_spans):
+        """Scan the lowercased, unfolded text of every topic (see raw_match_spans)"""
+        with self._lock:
+            keys = self._connect().execute("SELECT tab, title FROM search_topics ORDER BY seq").fetchall()
+            items = [(key, self.items[key]) for key in keys if key in self.items]
+        return scan_unfolded(items, query, exact, tabs, is_cancelled, with_spans)
+
+    def _regex_search(self, query, tabs, is_cancelled, with_spans):
+        """Same as SearchIndex._regex_search. The worker gets the folded texts read
+        from search_topics (only when the index changed since it last got them);
+        spans are computed from the rows of the matching topics."""
+        pattern = compile_search_regex(query)
+        raw = regex_runs_on_raw(pattern)
+        with self._lock:
+            rows = self._connect().execute("SELECT tab, title, id, source_hash FROM search_topics "
+                                           "ORDER BY seq").fetchall()
+            tag = (self.generation, raw)
+            if raw:
+                snapshot = [((tab_name, title), self.items[(tab_name, title)])
+                            for tab_name, title, _, _ in rows if (tab_name, title) in self.items]
+            else:
+                snapshot = [((tab_name, title), (row_id, source_hash)) for tab_name, title, row_id, source_hash in rows]
+
+        if raw:
+            def fields_of(key, source):
+                return unfolded_field_texts(key, source)
+
+            payload = lambda: [[text for _, text, _ in unfolded_field_texts(key, item_data)]
+                               for key, item_data in snapshot]
+        else:
+            def fields_of(key, source):
+                return sources[source[0]]
+
+            def payload():
+                texts = self._folded_fields([source for _, source in snapshot])
+                return [[text for _, text, _ in texts.get(source[0], ())] for _, source in snapshot]
+
+        hits = regex_worker.run(pattern, payload, first_only=not with_spans, tag=tag, is_cancelled=is_cancelled)
+        if not raw:
+            sources = self._folded_fields([snapshot[i][1] for i, _ in hits])
+            # A topic edited while the pattern ran no longer has the matched text
+            hits = [hit for hit in hits if snapshot[hit[0]][1][0] in sources]
+        return regex_hit_matches(hits, snapshot, fields_of, tabs, with_spans)
+
+    # --- Internal helpers ---
+    def _connect(self):
+        """The store's connection, with the search tables created or (after a
+        schema change) recreated. Called with the lock held."""
+        conn = self.store.connect()
+        if not self._schema_checked:
+            try:
+                version = conn.execute("SELECT value FROM search_meta WHERE key = 'version'").fetchone()
+            except sqlite3.OperationalError:
+                version = None
+            if version is None or version[0] != SEARCH_INDEX_VERSION:
+                with conn:
+                    for table in self.TABLES:
+                        conn.execute(f"DROP TABLE IF EXISTS {table}")
+                    for statement in self.SCHEMA:
+                        conn.execute(statement)
+                    conn.execute("INSERT INTO search_meta VALUES ('version', ?)", (SEARCH_INDEX_VERSION,))
+            self._schema_checked = True
+        return conn
+
+    @staticmethod
+    def _fold(title, item_data):
+        """Row values of one topic: (source hash, name, body, bounds, offset maps, terms)"""
+        text, bounds, offset_maps = fold_topic_fields(title, item_data)
+        return (topic_hash(title, item_data), text[bounds[0][1]:bounds[0][2]], text,
+                json.dumps(bounds), pack_offset_maps(offset_maps), set(TOKEN_RE.findall(text)))
+
+    def _write(self, conn, tab_name, title, seq, folded):
+        row = conn.execute("SELECT id FROM search_topics WHERE tab = ? AND title = ?", (tab_name, title)).fetchone()
+        if row is not None:
+            self._delete(conn, row[0])
+        source_hash, name, body, bounds, offset_maps, terms = folded
+        row_id = conn.execute(
+            "INSERT INTO search_topics (id, tab, title, seq, source_hash, name, body, bounds, offset_maps) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (row[0] if row else None, tab_name, title, seq, source_hash, name, body, bounds, offset_maps)).lastrowid
+        conn.executemany("INSERT INTO search_terms (term, id) VALUES (?, ?)", [(term, row_id) for term in terms])
+
+    @staticmethod
+    def _delete(conn, row_id):
+        conn.execute("DELETE FROM search_terms WHERE id = ?", (row_id,))
+        conn.execute("DELETE FROM search_topics WHERE id = ?", (row_id,))
+
+    @staticmethod
+    def _containing(conn, query, columns):
+        """Rows of the topics whose search text contains query, in database order"""
+        if len(query) >= 3:
+            # The trigram index narrows the rows; instr() checks the candidates
+            return conn.execute(
+                f"SELECT {columns} FROM search_topics WHERE id IN "
+                "(SELECT rowid FROM search_fts WHERE search_fts MATCH ?) AND instr(body, ?) > 0 ORDER BY seq",
+                (fts_phrase(query), query)).fetchall()
+        # Too short for trigrams
+        return conn.execute(f"SELECT {columns} FROM search_topics WHERE instr(body, ?) > 0 ORDER BY seq",
+                            (query,)).fetchall()
+
+    @staticmethod
+    def _fields(body, bounds, offset_maps):
+        """slice_fields() of one search_topics row"""
+        return slice_fields(body, json.loads(bounds), unpack_offset_maps(offset_maps))
+
+    def _folded_fields(self, sources):
+        """{row id: slice_fields() list} of the (row id, source hash) rows still unchanged"""
+        wanted = dict(sources)
+        fields = {}
+        with self._lock:
+            conn = self._connect()
+            for start in range(0, len(sources), SEARCH_INDEX_BATCH):
+                ids = [row_id for row_id, _ in sources[start:start + SEARCH_INDEX_BATCH]]
+                for row_id, source_hash, body, bounds, offset_maps in conn.execute(
+                        "SELECT id, source_hash, body, bounds, offset_maps FROM search_topics WHERE id IN "
+                        f"({', '.join('?' * len(ids))})", ids):
+                    if wanted[row_id] == source_hash:
+                        fields[row_id] = list(self._fields(body, bounds, offset_maps))
+        return fields
+
+    @staticmethod
+    def _fuzzy_terms(conn, token):
+        """{term: edit distance} for the terms within the token's typo budget"""
+        max_edits = fuzzy_max_edits(token)
+        if max_edits == 0:
+            return {token: 0}
+        grams = term_trigrams(token)
+        found = {}
+        for (term,) in conn.execute("SELECT DISTINCT term FROM search_terms WHERE length(term) BETWEEN ? AND ?",
+                                    (len(token) - max_edits, len(token) + max_edits)):
+            distance = fuzzy_term_distance(token, term, max_edits, grams)
+            if distance is not None:
+                found[term] = distance
+        return found
+
+
+class SQLiteRankedSearch:
+    """FTSSearchEngine interface over a SQLiteSearchIndex (whose tables the index
+    keeps current itself, so edits need nothing here)"""
+
+    def __init__(self, index):
+        self.index = index
+
+    def update_topic(self, tab_name, title, item_data):
+        pass
+
+    def remove_topic(self, tab_name, title):
+        pass
+
+    def search(self, query, exact=False, tabs=None, is_cancelled=None):
+        return self.index.ranked_search(query, exact, tabs, is_cancelled)
+
+
+# ============ SYNTAX HIGHLIGHTING ============
+# Keywords per language; "#" comments stay enabled for IOS as before
+HIGHLIGHT_LANGUAGES = {
+    "ios": (("!", "#"), ('show ', 'debug ', 'clear ', 'ping', 'traceroute', 'ssh', 'telnet')),
+    "bash": (("#",), ('ping', 'traceroute', 'ssh', 'telnet', 'nmap', 'curl', 'wget', 'systemctl', 'docker')),
+}
+TAB_LANGUAGES = {"🐧 Linux Ops": "bash"}
+DEFAULT_LANGUAGE = "ios"
+HIGHLIGHT_CACHE_SIZE = 512   # (topic, field) span sets kept by the highlighter
+
+
+def tab_language(tab_name):
+    return TAB_LANGUAGES.get(tab_name, DEFAULT_LANGUAGE)
+
+
+class SyntaxHighlighter:
+    """Line-level syntax tags for each language, from one compiled regex per
+    language (headers, comments and keywords in a single alternation).
+
+    Each text is lowercased and scanned once (cheaper than an IGNORECASE
+    regex); when a line has several matches the strongest tag wins
+    (header > comment > keyword). Results are cached per (topic, field,
+    language, content hash), so re-rendering an unchanged card reuses its
+    spans."""
+
+    # Lowest to highest priority
+    TAG_PRIORITY = ("keyword", "comment", "verify_header", "config_header")
+    TAG_RANK = dict(zip(TAG_PRIORITY, range(len(TAG_PRIORITY))))
+    HEADERS = {"=== configuration ===": "config_header", "--- configuration ---": "config_header",
+               "=== verification ===": "verify_header", "--- verification ---": "verify_header"}
+
+    def __init__(self, languages=HIGHLIGHT_LANGUAGES, cache_size=HIGHLIGHT_CACHE_SIZE):
+        self.patterns = {}      # language -> (regex, {matched text: tag}); other matches are comments
+        self.cache_size = cache_size
+        self._cache = OrderedDict()   # (key, language, hash) -> {tag: (indices)}
+        for name, (comment_prefixes, keywords) in languages.items():
+            self.add_language(name, comment_prefixes, keywords)
+
+    def add_language(self, name, comment_prefixes, keywords):
+        """Register (or replace) a rule set"""
+        def alternatives(words):
+            return "|".join(re.escape(word.lower()) for word in sorted(words, key=len, reverse=True))
+
+        # No capture groups: a flat alternation is much faster in re; matches are
+        # classified by their text instead
+        kinds = {word.lower(): "keyword" for word in keywords}
+        kinds.update(self.HEADERS)
+        pattern = re.compile(
+            alternatives(kinds) +
+            r"|^[^\S\n]*(?:" + alternatives(comment_prefixes) + ")",
+            re.MULTILINE)
+        self.patterns[name] = (pattern, kinds)
+        self._cache.clear()
+
+    def ranges(self, content, language=DEFAULT_LANGUAGE, cache_key=None):
+        """Return {tag: (start, end, ...)} Tk indices, one whole-line range per tagged line"""
+        if cache_key is not None:
+            key = (cache_key, language, hash(content))
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        pattern, kinds = self.patterns.get(language) or self.patterns[DEFAULT_LANGUAGE]
+        best = {}   # line number -> tag
+        lowered = content.lower()   # may change length, never the line breaks
+        line_no, line_end = 1, lowered.find('\n')
+        for match in pattern.finditer(lowered):
+            # Matches come in order, so the line number only moves forward
+            while line_end != -1 and match.start() > line_end:
+                line_no += 1
+                line_end = lowered.find('\n', line_end + 1)
+            tag = kinds.get(match.group(), "comment")
+            current = best.get(line_no)
+            if current is None or self.TAG_RANK[tag] > self.TAG_RANK[current]:
+                best[line_no] = tag
+
+        ranges = {tag: [] for tag in self.TAG_PRIORITY}
+        for line_no, tag in best.items():
+            ranges[tag] += (f"{line_no}.0", f"{line_no}.end")
+        ranges = {tag: tuple(indices) for tag, indices in ranges.items() if indices}
+
+        if cache_key is not None:
+            self._cache[key] = ranges
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return ranges
+
+    async def ranges_async(self, content, language=DEFAULT_LANGUAGE, cache_key=None):
+        return await asyncio.to_thread(self.ranges, content, language, cache_key)
+
+
+# ============ CORE API ============
+class QueryCache:
+    """Thread-safe LRU of finished search results. Keys carry the app's data
+    version, so an edit makes every older entry unreachable."""
+
+    def __init__(self, size=QUERY_CACHE_SIZE):
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Cached result or None"""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key, result):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class TopicStore:
+    """The topic database ({tab: {title: topic}}) on top of a storage backend
+    (a .db / .sqlite / .sqlite3 file name selects SQLite, anything else JSON)."""
+
+    def __init__(self, db_file):
+        self.db_file = db_file
+        self.backend = open_store(db_file)
+        self.data = {}
+        # Set when the database could not be read: the defaults are shown instead,
+        # and nothing is written so the file and its journal stay as they were
+        self.load_error = None
+
+    def exists(self):
+        return self.backend.exists()
+
+    def load(self):
+        """Load the database, creating it from the defaults when it does not exist"""
+        if self.backend.exists():
+            try:
+                self.data = self.backend.load()
+            except Exception as e:
+                print(f"Error loading data: {e}")
+                self.load_error = e
+                self.data = load_seed_data()
+        else:
+            # Switching to another backend: start from the JSON database if there is one
+            json_file = os.path.splitext(self.db_file)[0] + ".json"
+            if json_file != self.db_file and os.path.exists(json_file):
+                self.data = JsonStore(json_file).load()
+            else:
+                self.data = load_seed_data()
+            self.backend.save_all(self.data)
+        return self.data
+
+    def save_all(self):
+        """Save the whole database (not after a failed load)"""
+        if self.load_error is None:
+            self.backend.save_all(self.data)
+
+    def save_topics(self, changes):
+        """Save/delete a batch of {(tab, title): item or None}"""
+        if self.load_error is not None:
+            raise RuntimeError(f"{self.db_file} could not be loaded, edits are not saved ({self.load_error})")
+        self.backend.save_topics(changes)
+
+    def needs_compaction(self):
+        return self.load_error is None and self.backend.needs_compaction()
+
+    def compact(self, background=True):
+        if self.load_error is None:
+            self.backend.compact(self.data, background)
+
+    def content_hash(self):
+        """Digest of the saved database, or None if nothing was saved yet"""
+        return self.backend.content_hash() if self.backend.exists() else None
+
+    def search_index(self):
+        """Text index for SearchEngine: kept inside the database file for the SQLite
+        backend (when FTS5 is available and the file loaded), in memory otherwise"""
+        if isinstance(self.backend, SQLiteStore) and self.load_error is None and FTSSearchEngine.available():
+            return SQLiteSearchIndex(self.backend)
+        return SearchIndex()
+
+    async def load_async(self):
+        return await asyncio.to_thread(self.load)
+
+    async def save_topics_async(self, changes):
+        await asyncio.to_thread(self.save_topics, changes)
+
+
+class SearchEngine:
+    """Every search over a topic dict: the text index (substring, Exact Match,
+    fuzzy, regex), the IOS command index, optional FTS5 ranking, and a result
+    cache keyed on a data version that each edit bumps. index is the text index
+    to use (TopicStore.search_index()); an in-memory SearchIndex by default."""
+
+    def __init__(self, data, index=None):
+        self.data = data
+        self.index = index if index is not None else SearchIndex()
+        self.commands = CommandIndex()
+        if isinstance(self.index, SQLiteSearchIndex):
+            self.fts = SQLiteRankedSearch(self.index)
+        else:
+            self.fts = FTSSearchEngine(data) if FTSSearchEngine.available() else None   # built on first use
+        self.cache = QueryCache()
+        self.version = 0
+
+    def build(self, cache_file=None, source_hash=None, topics=None):
+        """Index every topic (the command catalog comes from cache_file when its hash matches).
+        topics is a topic_list() of the data taken on the thread that edits it; when
+        building in the background, pass one so the walk never races an edit."""
+        if topics is None:
+            topics = topic_list(self.data)
+        try:
+            self.index.build(topics)
+        finally:
+            # Even after a failure: an unbuilt command index would block every edit
+            self.commands.build(topics, cache_file, source_hash)
+
+    def update_topic(self, tab_name, title, item_data):
+        """Re-index one added/edited topic"""
+        self.index.update_topic(tab_name, title, item_data)
+        self.commands.update_topic(tab_name, title, item_data)
+        if self.fts is not None:
+            self.fts.update_topic(tab_name, title, item_data)
+        # After the indexes: a search reading the new version also sees the new text
+        self.bump_version()
+
+    def remove_topic(self, tab_name, title):
+        self.index.remove_topic(tab_name, title)
+        self.commands.remove_topic(tab_name, title)
+        if self.fts is not None:
+            self.fts.remove_topic(tab_name, title)
+        self.bump_version()
+
+    def bump_version(self):
+        """Invalidate cached results after a change to the data"""
+        self.version += 1
+        self.cache.clear()
+
+    def search(self, query, exact=False, tabs=None, is_cancelled=None, with_spans=False, fuzzy=False,
+               regex=False, ranked=False):
+        """Text index matches, followed (unless Exact Match) by topics containing
+        an IOS command the query abbreviates, e.g. 'sh ip int br'.
+        'mode:<mode>' / 'cmd:<command>' queries go to the command catalog only.
+        In regex mode the query is a pattern (SearchPatternError if invalid or too slow).
+        ranked returns BM25-ordered SearchHits instead (when FTS5 is available).
+        Results are cached per query, options and data version."""
+        ranked = ranked and self.fts is not None
+        key = self.cache_key(query, exact, tabs, with_spans, fuzzy, regex, ranked)
+        matches = self.cache.get(key)
+        if matches is not None:
+            return matches
+        if ranked:
+            matches = self.fts.search(query, exact, tabs, is_cancelled)
+        elif regex:
+            matches = self.index.search(query, tabs=tabs, is_cancelled=is_cancelled,
+                                        with_spans=with_spans, regex=True)
+        elif parse_catalog_query(query) is not None:
+            matches = self.commands.catalog_search(*parse_catalog_query(query), tabs=tabs, with_spans=with_spans)
+        else:
+            matches = self.index.search(query, exact, tabs, is_cancelled, with_spans, fuzzy)
+            if not exact:
+                matches = merge_matches(matches, self.commands.search(query, tabs, with_spans))
+        self.cache.put(key, matches)
+        return matches
+
+    def cached(self, query, exact=False, tabs=None, with_spans=False, fuzzy=False, regex=False, ranked=False):
+        """Result of the same search since the last edit, or None"""
+        ranked = ranked and self.fts is not None
+        return self.cache.get(self.cache_key(query, exact, tabs, with_spans, fuzzy, regex, ranked))
+
+    def cache_key(self, query, exact, tabs, with_spans, fuzzy, regex, ranked):
+        options = ("ranked",) if ranked else ("index", with_spans, fuzzy, regex)
+        return (query, exact, tuple(tabs) if tabs is not None else None) + options + (self.version,)
+
+    def save_command_cache(self, cache_file, source_hash):
+        """Persist the parsed command catalog (once it has been built)"""
+        if self.commands.ready.is_set():
+            self.commands.save_cache(cache_file, source_hash)
+
+    async def build_async(self, cache_file=None, source_hash=None):
+        await asyncio.to_thread(self.build, cache_file, source_hash)
+
+    async def search_async(self, query, exact=False, tabs=None, with_spans=False, fuzzy=False, regex=False,
+                           ranked=False):
+        return await asyncio.to_thread(self.search, query, exact, tabs, None, with_spans, fuzzy, regex, ranked)
@@ -5,7 +5,7 @@ a = Analysis(
     ['test.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('cisco_ccna_defaults.json.gz', '.')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,268 @@
+import json
+import os
+import re
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ccna_core as core
+
+
+@pytest.fixture(scope="module")
+def seed_data():
+    return core.load_seed_data()
+
+
+@pytest.fixture(scope="module")
+def seed_index(seed_data):
+    index = core.SearchIndex()
+    index.build(seed_data)
+    return index
+
+
+def baseline_search(data, query, exact=False):
+    """The original scan: substring (or \\b-bounded for Exact Match) in the lowercased topic text"""
+    results = []
+    for tab_name, items in data.items():
+        for title, item_data in items.items():
+            text = core.topic_search_text(title, item_data).lower()
+            if exact:
+                found = re.search(r'\b' + re.escape(query.lower()) + r'\b', text)
+            else:
+                found = query.lower() in text
+            if found:
+                results.append((tab_name, title))
+    return results
+
+
+# ============ SEARCH INDEX ============
+@pytest.mark.parametrize("query", ["ospf", "vlan", "ip", "show ip", "int", "switchport mode",
+                                   "access-list", "a", "ipv6", "no shutdown", "router-on", "xyz"])
+@pytest.mark.parametrize("exact", [False, True])
+def test_index_matches_baseline_scan(seed_data, seed_index, query, exact):
+    assert seed_index.search(query, exact=exact) == baseline_search(seed_data, query, exact)
+
+
+def test_index_follows_edits(seed_data):
+    index = core.SearchIndex()
+    index.build(seed_data)
+    tab_name, title = next((tab_name, title) for tab_name in seed_data for title in seed_data[tab_name])
+    index.update_topic(tab_name, title, dict(seed_data[tab_name][title], notes="zzqq unique"))
+    assert index.search("zzqq") == [(tab_name, title)]
+    index.remove_topic(tab_name, title)
+    assert index.search("zzqq") == []
+
+
+class UnreadableTopic(dict):
+    def get(self, *args):
+        raise OSError("unreadable")
+
+    def __getitem__(self, key):
+        raise OSError("unreadable")
+
+
+def test_failed_build_does_not_block_edits():
+    engine = core.SearchEngine({"Tab": {"a": {"code": "x"}, "b": UnreadableTopic()}})
+    with pytest.raises(OSError):
+        engine.build()
+    assert engine.index.ready.is_set() and engine.commands.ready.is_set()
+    engine.update_topic("Tab", "c", {"code": "hello"})
+    assert engine.search("hello") == [("Tab", "c")]
+
+
+def test_emoji_only_query_is_not_match_all(seed_data, seed_index):
+    assert seed_index.search("🔧") == baseline_search(seed_data, "🔧")
+    assert len(seed_index.search("🔧")) < sum(len(items) for items in seed_data.values())
+
+
+def test_regex_search_folds_pattern(seed_index):
+    assert len(seed_index.search("إيقاف", regex=True)) == len(seed_index.search("إيقاف"))
+    assert seed_index.search("✅", regex=True)
+
+
+def test_regex_budget_aborts():
+    pattern = core.compile_search_regex("a")
+    with pytest.raises(core.SearchPatternError):
+        core.regex_line_offsets("a\nb", pattern, time.perf_counter() - 1)
+
+
+@pytest.mark.parametrize("pattern", [r"(.|.)*%%%", r"(\w+\s?)+%"])
+def test_backtracking_regex_is_stopped(seed_index, pattern):
+    start = time.perf_counter()
+    with pytest.raises(core.SearchPatternError):
+        seed_index.search(pattern, regex=True)
+    assert time.perf_counter() - start < core.REGEX_TIME_BUDGET + 1
+    # The worker is replaced after being killed
+    assert seed_index.search("ospf", regex=True) == seed_index.search("ospf")
+
+
+@pytest.fixture(scope="module")
+def sqlite_store(tmp_path_factory, seed_data):
+    store = core.TopicStore(str(tmp_path_factory.mktemp("sqlite") / "db.db"))
+    store.data = seed_data
+    store.backend.save_all(seed_data)
+    return store
+
+
+@pytest.fixture(scope="module")
+def sqlite_index(sqlite_store, seed_data):
+    index = sqlite_store.search_index()
+    assert isinstance(index, core.SQLiteSearchIndex)
+    index.build(seed_data)
+    return index
+
+
+@pytest.mark.parametrize("query", ["ospf", "ip", "show ip", "a", "إيقاف", "🔧", "ospff", "swithcport mode"])
+@pytest.mark.parametrize("options", [{}, {"exact": True}, {"with_spans": True}, {"exact": True, "with_spans": True},
+                                     {"fuzzy": True, "with_spans": True}, {"tabs": ["📘 CCNA Fundamentals"]}])
+def test_sqlite_index_matches_memory_index(seed_index, sqlite_index, query, options):
+    assert sqlite_index.search(query, **options) == seed_index.search(query, **options)
+
+
+@pytest.mark.parametrize("query", ["ospf", r"\bvlan \d+", "إيقاف", "✅"])
+def test_sqlite_index_regex(seed_index, sqlite_index, query):
+    assert sqlite_index.search(query, regex=True, with_spans=True) == seed_index.search(query, regex=True,
+                                                                                         with_spans=True)
+
+
+@pytest.mark.skipif(not core.FTSSearchEngine.available(), reason="no FTS5 trigram tokenizer")
+@pytest.mark.parametrize("query", ["show ip", "sh", "إيقاف", "🔧"])
+def test_sqlite_ranked_matches_fts(seed_data, sqlite_index, query):
+    fts = core.FTSSearchEngine(seed_data)
+    for exact in (False, True):
+        # BM25 scores differ a little (the two tables fold the separators differently)
+        assert ([hit._replace(score=None) for hit in sqlite_index.ranked_search(query, exact)]
+                == [hit._replace(score=None) for hit in fts.search(query, exact)])
+
+
+def test_sqlite_index_rebuild_reads_changed_topics_only(tmp_path):
+    store = core.TopicStore(str(tmp_path / "db.db"))
+    data = store.load()
+    store.search_index().build(data)
+    tab_name, title = next((tab_name, title) for tab_name in data for title in data[tab_name])
+    store.backend.save_topic(tab_name, title, dict(data[tab_name][title], notes="zzqq unique"))
+
+    reopened = core.TopicStore(str(tmp_path / "db.db"))
+    # Bodies of unchanged topics are never read
+    topics = {tab: {key: UnreadableTopic() for key in items} for tab, items in reopened.load().items()}
+    topics[tab_name][title] = reopened.data[tab_name][title]
+    index = reopened.search_index()
+    index.build(topics)
+    assert index.search("zzqq") == [(tab_name, title)]
+    index.remove_topic(tab_name, title)
+    assert index.search("zzqq") == []
+
+
+def test_sqlite_content_hash_ignores_search_tables(tmp_path):
+    store = core.TopicStore(str(tmp_path / "db.db"))
+    data = store.load()
+    before = store.content_hash()
+    store.search_index().build(data)
+    assert store.content_hash() == before
+    store.save_topics({("Tab", "new"): {"code": "x"}})
+    assert store.content_hash() != before
+
+
+def test_nested_quantifier_rejected():
+    with pytest.raises(core.SearchPatternError):
+        core.compile_search_regex("(a+)+")
+
+
+# ============ FOLDING ============
+def test_spans_map_back_through_folding():
+    text = "01. 🔧 Basic\nإِيقاف x"
+    # The emoji is dropped from the folded text, the span still points at the raw columns
+    assert core.match_spans(text, core.normalize_search_text("basic")) == [(1, 6, 5)]
+    # Tashkeel and hamza fold away; the span covers the marked word
+    assert core.match_spans(text, core.normalize_search_text("ايقاف")) == [(2, 0, 6)]
+
+
+def test_dropped_emoji_leaves_one_space():
+    assert core.normalize_search_text("01. 🔧 Basic") == "01. basic"
+
+
+# ============ IOS COMMANDS ============
+@pytest.mark.parametrize("query, command", [("sh ip int br", "show ip interface brief"),
+                                            ("sw mode acc", "switchport mode access"),
+                                            ("no sh", "no shutdown")])
+def test_command_abbreviation(seed_data, query, command):
+    commands = core.CommandIndex()
+    commands.build(seed_data)
+    matches = commands.search(query, with_spans=True)
+    assert matches
+    for tab_name, title, spans in matches:
+        item_data = seed_data[tab_name][title]
+        for field, field_spans in spans.items():
+            lines = item_data[field].split('\n')
+            for line_no, col, length in field_spans:
+                assert lines[line_no - 1][col:col + length].lower().split() == command.split()
+
+
+# ============ STORAGE ============
+def test_journal_round_trip(tmp_path):
+    db_file = str(tmp_path / "db.json")
+    store = core.JsonStore(db_file)
+    store.save_all({"Tab": {"a": {"code": "one"}, "b": {"code": "two"}}})
+    store.save_topic("Tab", "a", {"code": "edited"})
+    store.delete_topic("Tab", "b")
+    store.save_topic("Tab", "c", {"code": "new"})
+    assert core.JsonStore(db_file).load() == {"Tab": {"a": {"code": "edited"}, "c": {"code": "new"}}}
+
+
+def test_journal_torn_line(tmp_path):
+    db_file = str(tmp_path / "db.json")
+    store = core.JsonStore(db_file)
+    store.save_all({"Tab": {"a": {"code": "one"}}})
+    store.save_topic("Tab", "a", {"code": "kept"})
+    with open(store.journal_file, 'a', encoding='utf-8') as f:
+        f.write('{"op": "upsert", "tab": "Tab", "title": "a", "it')   # crash mid-write
+
+    reopened = core.JsonStore(db_file)
+    assert reopened.load() == {"Tab": {"a": {"code": "kept"}}}
+    # The next entry starts on its own line instead of extending the torn one
+    reopened.save_topic("Tab", "b", {"code": "after"})
+    assert core.JsonStore(db_file).load() == {"Tab": {"a": {"code": "kept"}, "b": {"code": "after"}}}
+
+
+def test_failed_load_leaves_files_alone(tmp_path):
+    db_file = str(tmp_path / "db.json")
+    core.TopicStore(db_file).load()
+    core.JsonStore(db_file).save_topic("Tab", "a", {"code": "journaled"})
+    with open(db_file, 'w', encoding='utf-8') as f:
+        f.write("{broken")
+    before = {name: (tmp_path / name).read_bytes() for name in os.listdir(tmp_path)}
+
+    store = core.TopicStore(db_file)
+    store.load()
+    assert store.load_error is not None
+    store.compact(background=False)
+    store.save_all()
+    with pytest.raises(RuntimeError):
+        store.save_topics({("Tab", "a"): None})
+    assert {name: (tmp_path / name).read_bytes() for name in os.listdir(tmp_path)} == before
+
+
+def test_sqlite_upsert_keeps_position(tmp_path):
+    store = core.SQLiteStore(str(tmp_path / "db.sqlite"))
+    store.save_all({"Tab": {"a": {"code": "1"}, "b": {"code": "2\n3"}}, "Other": {"c": {"code": "4"}}})
+    store.save_topics({("Tab", "a"): {"code": "edited", "notes": "n"},
+                       ("Tab", "d"): {"code": "5"},
+                       ("Other", "c"): None})
+
+    data = store.load()
+    assert [(tab_name, title) for tab_name in data for title in data[tab_name]] == [
+        ("Tab", "a"), ("Tab", "b"), ("Tab", "d")]
+    assert data["Tab"]["a"]["code"] == "edited"
+    assert data["Tab"]["a"]["notes"] == "n"
+    assert core.topic_line_counts(data["Tab"]["b"])[0] == 1
+
+
+def test_sqlite_seeded_from_json(tmp_path):
+    with open(tmp_path / "db.json", 'w', encoding='utf-8') as f:
+        json.dump({"Tab": {"a": {"code": "from json"}}}, f)
+    store = core.TopicStore(str(tmp_path / "db.db"))
+    assert store.load()["Tab"]["a"]["code"] == "from json"
+    assert core.TopicStore(str(tmp_path / "db.db")).load()["Tab"]["a"]["code"] == "from json"